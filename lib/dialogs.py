@@ -58,17 +58,10 @@ def get_current_thumbnail():
         if thumb:
             return thumb
     
-    # Try video info tag
-    try:
-        player = xbmc.Player()
-        if player.isPlayingVideo():
-            info = player.getVideoInfoTag()
-            # Try to get art from info tag
-            thumb = xbmc.getInfoLabel('VideoPlayer.Cover')
-            if thumb:
-                return thumb
-    except:
-        pass
+    # Try video cover (empty when no video is playing)
+    thumb = xbmc.getInfoLabel('VideoPlayer.Cover')
+    if thumb:
+        return thumb
     
     # Try ListItem art
     thumb = xbmc.getInfoLabel('ListItem.Art(thumb)')
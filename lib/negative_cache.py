@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Negative Cache - Bloom filter of subtitle streams that recently failed to extract.
+
+A corrupt or unsupported stream makes FFmpeg run until its timeout, and
+every later playback of the same file would repeat that run. The filter
+remembers (file, stream index) pairs that failed so they can be skipped.
+"""
+
+import hashlib
+import math
+import os
+import threading
+import time
+from array import array
+
+import xbmc
+
+# Failures expected within one TTL and the false positive rate the
+# filter is sized for (m = -n ln p / ln(2)^2 slots, k = m/n ln 2 hashes)
+_EXPECTED_ENTRIES = 256
+_FALSE_POSITIVE_RATE = 0.001
+_FILTER_SLOTS = math.ceil(-_EXPECTED_ENTRIES * math.log(_FALSE_POSITIVE_RATE) / math.log(2) ** 2)
+_HASH_COUNT = max(1, round(_FILTER_SLOTS / _EXPECTED_ENTRIES * math.log(2)))
+# Each slot holds the time of the latest failure that set it, so entries
+# expire on their own; a transient failure only skips a stream this long
+_ENTRY_TTL = 6 * 3600
+
+
+class NegativeCache:
+    """Bloom filter of (file, stream index) pairs, persisted to disk."""
+    
+    def __init__(self, addon_data_path, filename='negative_cache.bin'):
+        self.path = os.path.join(addon_data_path, filename)
+        self._lock = threading.Lock()
+        self._slots = None
+    
+    def _load(self):
+        """Read the filter from disk on first use."""
+        if self._slots is None:
+            slots = array('I', [0]) * _FILTER_SLOTS
+            try:
+                with open(self.path, 'rb') as f:
+                    data = f.read()
+                if len(data) == len(slots) * slots.itemsize:
+                    slots = array('I', data)
+            except OSError:
+                pass
+            self._slots = slots
+        return self._slots
+    
+    def _save(self):
+        """Persist the filter."""
+        try:
+            with open(self.path, 'wb') as f:
+                self._slots.tofile(f)
+        except OSError as e:
+            self._log(f"Could not save negative cache: {e}", xbmc.LOGWARNING)
+    
+    @staticmethod
+    def _positions(video_path, stream_index):
+        """Slot positions by double hashing one 16-byte BLAKE2b digest."""
+        digest = hashlib.blake2b(f'{video_path}\x00{stream_index}'.encode('utf-8'),
+                                 digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % _FILTER_SLOTS for i in range(_HASH_COUNT)]
+    
+    @staticmethod
+    def _live(slots, positions):
+        """True if every position was set within the TTL."""
+        cutoff = time.time() - _ENTRY_TTL
+        return all(slots[p] > cutoff for p in positions)
+    
+    def contains(self, video_path, stream_index):
+        """True if the stream probably failed recently (never a false negative)."""
+        with self._lock:
+            return self._live(self._load(), self._positions(video_path, stream_index))
+    
+    def add(self, video_path, stream_index):
+        """Record a failed extraction and persist the filter."""
+        with self._lock:
+            slots = self._load()
+            now = int(time.time())
+            for p in self._positions(video_path, stream_index):
+                slots[p] = now
+            self._save()
+    
+    def discard(self, video_path, stream_index):
+        """Forget a stream that extracted fine. Other entries sharing a
+        slot may be forgotten too, which only costs a retry."""
+        with self._lock:
+            slots = self._load()
+            positions = self._positions(video_path, stream_index)
+            if not self._live(slots, positions):
+                return
+            for p in positions:
+                slots[p] = 0
+            self._save()
+    
+    def clear(self):
+        """Forget every entry (e.g. after the FFmpeg settings changed)."""
+        with self._lock:
+            self._slots = array('I', [0]) * _FILTER_SLOTS
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+    
+    def _log(self, message, level=xbmc.LOGINFO):
+        """Log message."""
+        xbmc.log(f"[NegativeCache] {message}", level)
@@ -230,8 +230,8 @@ class ErrorReporter:
         """Load existing error log."""
         if xbmcvfs.exists(self.error_log_path):
             try:
-                with xbmcvfs.File(self.error_log_path, 'r') as f:
-                    self.errors = json.loads(f.read())
+                with xbmcvfs.File(self.error_log_path, 'rb') as f:
+                    self.errors = json.loads(bytes(f.readBytes()))
             except:
                 self.errors = []
     
@@ -239,8 +239,8 @@ class ErrorReporter:
         """Save error log."""
         # Keep only last 100 errors
         self.errors = self.errors[-100:]
-        with xbmcvfs.File(self.error_log_path, 'w') as f:
-            f.write(json.dumps(self.errors, indent=2, ensure_ascii=False))
+        with xbmcvfs.File(self.error_log_path, 'wb') as f:
+            f.write(json.dumps(self.errors, indent=2, ensure_ascii=False).encode('utf-8'))
     
     def report_error(self, error_type, message, exception=None, context=None):
         """
@@ -328,8 +328,8 @@ class ErrorReporter:
         }
         
         report_path = os.path.join(self.log_path, f"diagnostics_{int(time.time())}.json")
-        with xbmcvfs.File(report_path, 'w') as f:
-            f.write(json.dumps(report, indent=2, ensure_ascii=False))
+        with xbmcvfs.File(report_path, 'wb') as f:
+            f.write(json.dumps(report, indent=2, ensure_ascii=False).encode('utf-8'))
         
         return report_path
     
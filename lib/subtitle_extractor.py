@@ -166,6 +166,13 @@ def download_ffmpeg_android(progress_callback=None):
     return ffmpeg_path if os.path.isfile(ffmpeg_path) else None
 
 
+def decode_subtitle(data):
+    """Decode raw subtitle bytes as UTF-8 (BOM stripped, bad bytes replaced)."""
+    if data[:3] == b'\xef\xbb\xbf':
+        data = data[3:]
+    return data.decode('utf-8', errors='replace')
+
+
 def get_kodi_temp_path():
     """Get Kodi's temp directory (works on all platforms including Android)."""
     try:
@@ -553,21 +560,20 @@ class SubtitleExtractor:
         if not resolved_path:
             return None
         
-        # Create temp file for output (uses Kodi temp dir — Android-safe)
-        output_path = self._make_temp_file(suffix=f'.{output_format}')
-        
         try:
             # Build FFmpeg command
-            # Use 0:s:N to select the Nth subtitle stream (relative index)
+            # Use 0:s:N to select the Nth subtitle stream (relative index);
+            # the subtitle is piped to stdout instead of a temp file
+            codec = self._get_codec(output_format)
             cmd = [
                 self.ffmpeg_path,
-                '-y',  # Overwrite output
                 '-hide_banner',
                 '-loglevel', 'warning',
                 '-i', resolved_path,
                 '-map', f'0:s:{stream_index}',  # Select Nth subtitle stream
-                '-c:s', self._get_codec(output_format),
-                output_path
+                '-c:s', codec,
+                '-f', codec,
+                'pipe:1'
             ]
             
             self._log(f"Running FFmpeg: {' '.join(cmd)}")
@@ -575,12 +581,11 @@ class SubtitleExtractor:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=300  # 5 minutes timeout
             )
             
             if result.returncode != 0:
-                error_msg = result.stderr.strip() if result.stderr else "Unknown error"
+                error_msg = result.stderr.decode('utf-8', 'replace').strip() if result.stderr else "Unknown error"
                 self._log(f"FFmpeg failed (code {result.returncode}): {error_msg}", xbmc.LOGERROR)
                 
                 # Try alternative extraction method
@@ -589,14 +594,7 @@ class SubtitleExtractor:
                     return content
                 return None
             
-            # Check if output file was created and has content
-            if not os.path.exists(output_path):
-                self._log("FFmpeg did not create output file", xbmc.LOGERROR)
-                return None
-            
-            # Read extracted subtitle
-            with open(output_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
+            content = decode_subtitle(result.stdout)
             
             if not content or len(content.strip()) == 0:
                 self._log("FFmpeg produced empty output", xbmc.LOGERROR)
@@ -615,12 +613,6 @@ class SubtitleExtractor:
             return None
         finally:
             # Clean up temp files
-            try:
-                if os.path.exists(output_path):
-                    os.unlink(output_path)
-            except:
-                pass
-            
             if is_temp_input and temp_input:
                 try:
                     os.unlink(temp_input)
@@ -642,19 +634,18 @@ class SubtitleExtractor:
         
         global_index = streams[stream_index].get('global_index', stream_index)
         
-        output_path = self._make_temp_file(suffix=f'.{output_format}')
-        
         try:
             # Try with global stream index
+            codec = self._get_codec(output_format)
             cmd = [
                 self.ffmpeg_path,
-                '-y',
                 '-hide_banner',
                 '-loglevel', 'warning',
                 '-i', video_path,
                 '-map', f'0:{global_index}',  # Use global index
-                '-c:s', self._get_codec(output_format),
-                output_path
+                '-c:s', codec,
+                '-f', codec,
+                'pipe:1'
             ]
             
             self._log(f"Alternative FFmpeg: {' '.join(cmd)}")
@@ -662,13 +653,11 @@ class SubtitleExtractor:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=300
             )
             
-            if result.returncode == 0 and os.path.exists(output_path):
-                with open(output_path, 'r', encoding='utf-8', errors='replace') as f:
-                    content = f.read()
+            if result.returncode == 0:
+                content = decode_subtitle(result.stdout)
                 if content and len(content.strip()) > 0:
                     self._log(f"Alternative extraction succeeded: {len(content)} bytes")
                     return content
@@ -678,12 +667,6 @@ class SubtitleExtractor:
         except Exception as e:
             self._log(f"Alternative extraction failed: {e}", xbmc.LOGERROR)
             return None
-        finally:
-            try:
-                if os.path.exists(output_path):
-                    os.unlink(output_path)
-            except:
-                pass
     
     def _get_codec(self, format_name):
         """Get FFmpeg codec name for subtitle format."""
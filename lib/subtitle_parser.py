@@ -23,29 +23,40 @@ class SubtitleParser:
         
         Returns list of entries.
         """
+        return list(self.parse_iter(content, format_hint))
+    
+    def parse_iter(self, content, format_hint=None):
+        """
+        Parse subtitle content, yielding entries one at a time.
+        
+        Same entries as parse(), for callers that consume them in a
+        single pass.
+        """
         if not content:
-            return []
+            return iter(())
+        
+        # Strip a UTF-8 byte order mark left by the decoder
+        if content[0] == '\ufeff':
+            content = content[1:]
         
         # Auto-detect format if not specified
         if not format_hint:
             format_hint = self._detect_format(content)
         
-        if format_hint == 'srt':
-            return self._parse_srt(content)
-        elif format_hint in ('ass', 'ssa'):
-            return self._parse_ass(content)
+        if format_hint in ('ass', 'ssa'):
+            return iter(self._parse_ass(content))
         elif format_hint == 'vtt':
-            return self._parse_vtt(content)
+            return iter(self._parse_vtt(content))
         else:
-            # Try SRT as fallback
-            return self._parse_srt(content)
+            # SRT, also tried as fallback
+            return self._iter_srt(content)
     
     def generate(self, entries, output_format='srt'):
         """
         Generate subtitle content from entries.
         
         Args:
-            entries: List of subtitle entries
+            entries: Subtitle entries (any iterable, consumed once)
             output_format: Output format (srt, ass, vtt)
         
         Returns subtitle content as string.
@@ -72,12 +83,12 @@ class SubtitleParser:
     
     def _parse_srt(self, content):
         """Parse SRT format subtitles."""
-        entries = []
-        
+        return list(self._iter_srt(content))
+    
+    def _iter_srt(self, content):
+        """Parse SRT format subtitles, yielding entries."""
         # Split into blocks
-        blocks = re.split(r'\n\n+', content.strip())
-        
-        for block in blocks:
+        for block in re.split(r'\n\n+', content.strip()):
             lines = block.strip().split('\n')
             if len(lines) < 3:
                 continue
@@ -101,16 +112,14 @@ class SubtitleParser:
                 text = '\n'.join(lines[2:])
                 text = self._clean_text(text)
                 
-                entries.append({
+                yield {
                     'index': index,
                     'start': start,
                     'end': end,
                     'text': text
-                })
+                }
             except (ValueError, IndexError):
                 continue
-        
-        return entries
     
     def _parse_ass(self, content):
         """Parse ASS/SSA format subtitles."""
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Translation Memory - Disk-backed cue translation store shared across runs.
+
+Episodes of a series share a lot of dialog (intros, outros, catchphrases).
+Keeping cue translations in SQLite lets later jobs skip the network for
+lines that were already translated. Entries expire like cached subtitle
+files, so corrected service output eventually replaces old translations.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+import xbmc
+
+# SQLite's default limit on host parameters is 999
+_MAX_PARAMS = 500
+
+
+class TranslationMemory:
+    """SQLite store of (service, source, target, text) -> translation."""
+    
+    def __init__(self, addon_data_path, filename='tm.sqlite', max_age=None):
+        self.db_path = os.path.join(addon_data_path, filename)
+        # Seconds an entry stays valid; None or 0 keeps entries forever
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._conn = None
+    
+    def _connect(self):
+        """Open the database on first use."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS tm '
+                         '(key BLOB PRIMARY KEY, val TEXT, ts INTEGER NOT NULL DEFAULT 0)')
+            # Databases from before expiry tracking lack ts; their rows
+            # get 0 and so count as expired
+            if 'ts' not in {row[1] for row in conn.execute('PRAGMA table_info(tm)')}:
+                conn.execute('ALTER TABLE tm ADD COLUMN ts INTEGER NOT NULL DEFAULT 0')
+            conn.commit()
+            self._conn = conn
+        return self._conn
+    
+    @staticmethod
+    def _key(service, source_lang, target_lang, text):
+        """Compact 20-byte key for one cue."""
+        raw = f'{service}\x00{source_lang}\x00{target_lang}\x00{text}'
+        return hashlib.sha1(raw.encode('utf-8')).digest()
+    
+    def get_many(self, service, source_lang, target_lang, texts):
+        """
+        Look up translations for texts.
+        
+        Returns:
+            Dict of text -> translation for the texts found
+        """
+        if not texts:
+            return {}
+        keys = {self._key(service, source_lang, target_lang, t): t for t in texts}
+        found = {}
+        cutoff = self._cutoff()
+        
+        try:
+            with self._lock:
+                conn = self._connect()
+                key_list = list(keys)
+                for start in range(0, len(key_list), _MAX_PARAMS):
+                    part = key_list[start:start + _MAX_PARAMS]
+                    placeholders = ','.join('?' * len(part))
+                    rows = conn.execute(
+                        f'SELECT key, val FROM tm WHERE key IN ({placeholders}) AND ts >= ?',
+                        part + [cutoff])
+                    for key, val in rows:
+                        found[keys[bytes(key)]] = val
+        except Exception as e:
+            self._log(f"Lookup failed: {e}", xbmc.LOGWARNING)
+        
+        return found
+    
+    def put_many(self, service, source_lang, target_lang, pairs):
+        """Store (text, translation) pairs in a single transaction."""
+        now = int(time.time())
+        rows = [(self._key(service, source_lang, target_lang, text), value, now)
+                for text, value in pairs]
+        if not rows:
+            return
+        
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.executemany('INSERT OR REPLACE INTO tm (key, val, ts) VALUES (?, ?, ?)',
+                                     rows)
+        except Exception as e:
+            self._log(f"Store failed: {e}", xbmc.LOGWARNING)
+    
+    def prune(self):
+        """Delete expired entries."""
+        if not self.max_age:
+            return
+        
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    removed = conn.execute('DELETE FROM tm WHERE ts < ?',
+                                           (self._cutoff(),)).rowcount
+            if removed:
+                self._log(f"Removed {removed} expired entries")
+        except Exception as e:
+            self._log(f"Prune failed: {e}", xbmc.LOGWARNING)
+    
+    def _cutoff(self):
+        """Oldest timestamp still valid."""
+        return int(time.time()) - self.max_age if self.max_age else 0
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    def _log(self, message, level=xbmc.LOGINFO):
+        """Log message."""
+        xbmc.log(f"[TranslationMemory] {message}", level)
@@ -3,11 +3,359 @@
 Translation Services - Support for multiple translation APIs.
 """
 
+import hashlib
 import json
+import re
+import ssl
+import threading
+import time
 import urllib.request
 import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from types import MappingProxyType
 import xbmc
 
+# orjson is much faster for the large LLM responses, but is not bundled with
+# Kodi's Python - fall back to the stdlib json module when it's missing.
+try:
+    import orjson
+    _jdumps = orjson.dumps
+    _jloads = orjson.loads
+except ImportError:
+    def _jdumps(obj):
+        """Serialize obj to UTF-8 encoded JSON bytes."""
+        return json.dumps(obj).encode('utf-8')
+    
+    def _jloads(data):
+        """Parse JSON from bytes, bytearray or str."""
+        return json.loads(data if isinstance(data, str) else data.decode('utf-8'))
+
+# httpx (with the h2 package) lets the cloud/LLM translators multiplex
+# concurrent chunk requests over one HTTP/2 connection. Both are optional;
+# urllib (HTTP/1.1) is used when they aren't installed.
+# They are imported on first use so services that never touch them (or
+# installs without them) don't pay the import cost at startup.
+_http_client = None
+_http_client_checked = False
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client():
+    """Get the shared httpx client (lazy loaded), or None without httpx."""
+    global _http_client, _http_client_checked
+    if _http_client_checked:
+        return _http_client
+    with _http_client_lock:
+        if not _http_client_checked:
+            try:
+                import httpx
+                try:
+                    import h2  # noqa: F401 - required by httpx for http2=True
+                    http2 = True
+                except ImportError:
+                    http2 = False
+                _http_client = httpx.Client(
+                    http2=http2,
+                    limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+                )
+            except ImportError:
+                _http_client = None
+            _http_client_checked = True
+    return _http_client
+
+# Provider payload limits (items per request)
+DEEPL_MAX_TEXTS = 50
+GOOGLE_MAX_SEGMENTS = 128
+MS_MAX_ARRAY = 100
+MS_MAX_CHARS = 50_000
+
+# Language code -> DeepL target/source code
+_DEEPL_LANG_MAP = MappingProxyType({
+    'en': 'EN', 'sv': 'SV', 'de': 'DE', 'fr': 'FR',
+    'es': 'ES', 'it': 'IT', 'nl': 'NL', 'pl': 'PL',
+    'pt': 'PT-PT', 'ru': 'RU', 'ja': 'JA', 'zh': 'ZH',
+    'da': 'DA', 'fi': 'FI', 'no': 'NB', 'ko': 'KO'
+})
+
+# DeepL target languages that support formality
+_DEEPL_FORMALITY_LANGS = frozenset({
+    'DE', 'FR', 'IT', 'ES', 'NL', 'PL', 'PT-PT', 'PT-BR', 'RU', 'SV', 'DA', 'JA'
+})
+
+# Language code -> English language name (used in LLM prompts)
+_LANG_NAMES = MappingProxyType({
+    'sv': 'Swedish', 'en': 'English', 'de': 'German', 'fr': 'French',
+    'es': 'Spanish', 'it': 'Italian', 'no': 'Norwegian', 'da': 'Danish',
+    'fi': 'Finnish', 'nl': 'Dutch', 'pl': 'Polish', 'pt': 'Portuguese',
+    'ru': 'Russian', 'ja': 'Japanese', 'zh': 'Chinese', 'ko': 'Korean',
+    'ar': 'Arabic', 'tr': 'Turkish', 'hi': 'Hindi', 'uk': 'Ukrainian'
+})
+
+
+# One SSL context (CA bundle loaded once) and opener for the urllib path
+_SSL_CTX = ssl.create_default_context()
+_OPENER = urllib.request.build_opener(urllib.request.HTTPSHandler(context=_SSL_CTX))
+
+# Read size for streaming response bodies
+_READ_CHUNK = 65536
+
+# Request spacing after HTTP 429: doubled per rate-limited reply (capped),
+# then shortened by a fixed step per successful request
+_RATE_LIMIT_MIN_INTERVAL = 0.5
+_RATE_LIMIT_MAX_INTERVAL = 30.0
+_RATE_LIMIT_STEP = 0.1
+# Longest single sleep while waiting to send, so cancel and Kodi
+# shutdown are noticed promptly
+_WAIT_SLICE = 0.2
+
+
+def _rate_limit_info(error):
+    """
+    Inspect a failed request (requests, httpx or urllib error).
+    
+    Returns:
+        (True if the reply was HTTP 429, Retry-After seconds or None)
+    """
+    response = getattr(error, 'response', None)
+    status = getattr(response, 'status_code', None) or getattr(error, 'code', None)
+    if status != 429:
+        return False, None
+    headers = getattr(response, 'headers', None) or getattr(error, 'headers', None) or {}
+    try:
+        # The HTTP-date form is rare for APIs and ignored here
+        return True, max(0.0, float(headers.get('Retry-After')))
+    except (TypeError, ValueError):
+        return True, None
+
+
+def _read_body(response):
+    """Read a urllib response body into one buffer.
+    
+    When Content-Length is known the buffer is allocated up front and
+    filled with readinto(), avoiding the intermediate copies of read().
+    """
+    try:
+        length = int(response.headers.get('Content-Length') or 0)
+    except ValueError:
+        length = 0
+    if length <= 0:
+        return response.read()
+    
+    body = bytearray(length)
+    view = memoryview(body)
+    pos = 0
+    while pos < length:
+        n = response.readinto(view[pos:pos + _READ_CHUNK])
+        if not n:
+            break
+        pos += n
+    view.release()
+    if pos < length:
+        del body[pos:]
+    return body
+
+
+# Short-line packing for services that send one request per cue
+_PACK_MAX_LINE = 40
+_PACK_MAX_CHARS = 400
+
+
+def _pack_short_lines(texts):
+    """
+    Group runs of short single-line texts into newline-joined units.
+    
+    Returns:
+        (units to translate, list of the texts positions each unit covers)
+    """
+    units = []
+    groups = []
+    run = []
+    run_size = 0
+    
+    def flush():
+        if run:
+            units.append('\n'.join(texts[i] for i in run))
+            groups.append(list(run))
+            run.clear()
+    
+    for i, text in enumerate(texts):
+        if len(text) >= _PACK_MAX_LINE or '\n' in text:
+            units.append(text)
+            groups.append([i])
+            continue
+        if run and run_size + len(text) + 1 > _PACK_MAX_CHARS:
+            flush()
+            run_size = 0
+        run.append(i)
+        run_size += len(text) + 1
+    flush()
+    return units, groups
+
+
+def _chunked(items, max_items, max_size=None, size=len):
+    """Yield consecutive slices of items, honouring an item count limit and
+    an optional total size limit (measured with size())."""
+    chunk = []
+    chunk_size = 0
+    for item in items:
+        item_size = size(item) if max_size else 0
+        if chunk and (len(chunk) >= max_items or
+                      (max_size and chunk_size + item_size > max_size)):
+            yield chunk
+            chunk = []
+            chunk_size = 0
+        chunk.append(item)
+        chunk_size += item_size
+    if chunk:
+        yield chunk
+
+
+# Cues with nothing to translate: blanks, numbers, punctuation/music
+# symbols and lone ASS override tags like {\an8}
+_NO_TRANSLATE = re.compile(r'^[\s\W\d_]*$|^\s*\{[^}]*\}\s*$')
+
+
+def _utf8_len(text):
+    """Size of text in UTF-8 bytes."""
+    return len(text.encode('utf-8'))
+
+
+# Output token budget for LLM replies: a fixed allowance plus per cue
+# JSON overhead and up to one token per source character (CJK targets)
+_REPLY_BASE_TOKENS = 256
+_REPLY_TOKENS_PER_CUE = 16
+_REPLY_MAX_TOKENS = 16384
+
+
+def _reply_token_budget(texts):
+    """max_tokens for an LLM reply translating texts."""
+    wanted = _REPLY_BASE_TOKENS + sum(len(t) + _REPLY_TOKENS_PER_CUE for t in texts)
+    return min(wanted, _REPLY_MAX_TOKENS)
+
+
+def _cues_payload(texts):
+    """Encode texts as the indexed JSON cue list sent to LLM translators."""
+    return json.dumps({'cues': [{'i': i, 't': t} for i, t in enumerate(texts)]},
+                      ensure_ascii=False)
+
+
+def _extract_json(reply):
+    """Parse JSON from an LLM reply, tolerating code fences or extra prose."""
+    reply = reply.strip()
+    try:
+        return json.loads(reply)
+    except ValueError:
+        pass
+    
+    # Try the outermost {...} / [...] span, whichever starts first
+    spans = []
+    for open_char, close_char in (('{', '}'), ('[', ']')):
+        start, end = reply.find(open_char), reply.rfind(close_char)
+        if 0 <= start < end:
+            spans.append((start, end))
+    for start, end in sorted(spans):
+        try:
+            return json.loads(reply[start:end + 1])
+        except ValueError:
+            continue
+    return None
+
+
+def _parse_cues(parsed, count):
+    """
+    Map a parsed LLM reply back onto cue positions.
+    
+    Accepts {"cues": [{"i": .., "t": ..}]}, a bare list of such objects, or a
+    list of strings of exactly the expected length.
+    
+    Returns:
+        List of length count with None for cues missing from the reply
+    """
+    translated = [None] * count
+    if isinstance(parsed, dict):
+        parsed = parsed.get('cues')
+    if not isinstance(parsed, list):
+        return translated
+    
+    if len(parsed) == count and all(isinstance(t, str) for t in parsed):
+        return list(parsed)
+    
+    for cue in parsed:
+        if not isinstance(cue, dict):
+            continue
+        i, text = cue.get('i'), cue.get('t')
+        if isinstance(i, int) and 0 <= i < count and isinstance(text, str):
+            translated[i] = text
+    return translated
+
+
+class _LRUCache:
+    """Thread-safe LRU cache with an optional time-to-live (seconds)."""
+    
+    def __init__(self, maxsize=4096, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the cached value for key, or None if missing/expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, stored_at = item
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        """Store value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._data[key] = (value, time.monotonic())
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached entries."""
+        with self._lock:
+            self._data.clear()
+
+
+# Shared across translator instances so repeated cues ("Yeah.", "No.", speaker
+# tags) are only sent to a service once per Kodi session.
+_translation_cache = _LRUCache(maxsize=4096)
+
+
+class TranslationError(Exception):
+    """Raised when a translation service call fails. Translators raise it
+    instead of returning the input, so callers can tell a dead service
+    from a reply and fall back."""
+
+
+class RateLimitError(TranslationError):
+    """Raised when a service answered HTTP 429."""
+    
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        # Seconds the service asked us to wait (Retry-After), if given
+        self.retry_after = retry_after
+
+
+def _service_error(service, error):
+    """Wrap a failed request in a TranslationError; translation errors
+    (such as RateLimitError) are passed through unchanged."""
+    if isinstance(error, TranslationError):
+        return error
+    wrapped = TranslationError(f"{service} error: {error}")
+    wrapped.__cause__ = error
+    return wrapped
+
 
 def get_translator(service_name, config):
     """
@@ -20,34 +368,89 @@ def get_translator(service_name, config):
     Returns:
         Translator instance
     """
-    translators = {
-        'deepl': DeepLTranslator,
-        'deepl_free': DeepLTranslator,
-        'libretranslate': LibreTranslateTranslator,
-        'mymemory': MyMemoryTranslator,
-        'google': GoogleTranslator,
-        'microsoft': MicrosoftTranslator,
-        'lingva': LingvaTranslator,
-        'openai': OpenAITranslator,
-        'anthropic': AnthropicTranslator,
-        'argos': ArgosTranslator,
-    }
-    
-    translator_class = translators.get(service_name, LibreTranslateTranslator)
+    # Argos pulls in argostranslate/CTranslate2, so only import it on demand
+    if service_name == 'argos':
+        from lib.translators_argos import ArgosTranslator
+        return ArgosTranslator(config)
+    
+    translator_class = _TRANSLATORS.get(service_name, LibreTranslateTranslator)
     return translator_class(config)
 
 
 class BaseTranslator:
-    """Base class for translation services."""
+    """Base class for translation services.
+    
+    translate_batch() is the fast path: it dedups, consults the cache and
+    lets batch-capable services send many cues per request. translate()
+    is meant for one-off strings; the default _translate_batch_impl that
+    loops over _translate_impl only exists for services without a batch
+    endpoint.
+    """
+    
+    # Route requests through the shared HTTP/2 client when httpx is available
+    use_http2 = False
+    # Cap on requests the service keeps in flight (None = no extra limit)
+    max_concurrency = None
+    # Minimum seconds between request starts, for rate-limited services.
+    # The spacing in use grows above this on HTTP 429 and decays back.
+    min_request_interval = 0
+    # Service sends one request per cue, so packing short cues saves requests
+    packs_short_lines = False
+    # Service sees the media context, so it is part of the cache identity
+    uses_media_context = False
+    # Requests are paid for (or count against a quota), so batches are
+    # never sent to it speculatively
+    billed = False
+    # Settings that change what the service returns for the same text
+    _FINGERPRINT_ATTRS = ('base_url', 'model', 'formality', 'glossary_id')
     
     def __init__(self, config):
         self.config = config
         self.timeout = config.get('timeout', 30)
+        self.pack_short_lines = self.packs_short_lines and config.get('pack_short_lines', False)
         self.media_context = config.get('media_context', {})
+        concurrency = max(1, int(config.get('concurrency', 4)))
+        self.concurrency = min(concurrency, self.max_concurrency or concurrency)
+        # Caps requests in flight over all batches sharing this translator,
+        # so concurrent batches times chunk workers can't exceed it
+        self._request_slots = threading.BoundedSemaphore(self.concurrency)
+        self._cache = _translation_cache
+        # Optional disk-backed TranslationMemory shared across runs
+        self._memory = config.get('translation_memory')
+        self._client = _get_http_client() if self.use_http2 else None
+        # Shared requests.Session (keep-alive pool + retries) from the service
+        self._session = config.get('session')
+        # Per-instance request headers (auth etc.), built once
+        self._default_headers = {}
+        self._throttle_lock = threading.Lock()
+        self._last_request = 0.0
+        self._request_interval = self.min_request_interval
+        # monotonic() time before which no request may start (Retry-After)
+        self._not_before = 0.0
+        # Set by cancel(); interrupts request waits
+        self._cancelled = threading.Event()
+        # Built on first use, once subclasses have set their attributes
+        self._service_key = None
     
     def set_media_context(self, context):
         """Set media context (title, plot, genre, season/episode etc)."""
         self.media_context = context or {}
+        self._service_key = None
+    
+    def _service_id(self):
+        """
+        Identity of this service configuration for the translation cache
+        and memory: class name plus a hash of the settings (and, for
+        context-aware services, the media context) that shape its output.
+        """
+        service_key = self._service_key
+        if service_key is None:
+            parts = [repr(getattr(self, attr, None)) for attr in self._FINGERPRINT_ATTRS]
+            if self.uses_media_context:
+                parts.append(json.dumps(self.media_context, sort_keys=True, default=str))
+            digest = hashlib.blake2b('\x00'.join(parts).encode('utf-8'), digest_size=8).hexdigest()
+            service_key = self._service_key = f'{type(self).__name__}:{digest}'
+        return service_key
     
     def _build_context_string(self):
         """Build a context string from media metadata for translation engines."""
@@ -76,35 +479,344 @@ class BaseTranslator:
         return ' | '.join(parts)
     
     def translate(self, text, source_lang, target_lang):
-        """Translate a single text string."""
-        raise NotImplementedError
+        """Translate a single text string, serving repeats from the cache."""
+        if not text or _NO_TRANSLATE.match(text):
+            return text
+        
+        key = self._cache_key(text, source_lang, target_lang)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        if self._memory is not None:
+            stored = self._memory.get_many(key[0], source_lang, target_lang, [text])
+            if text in stored:
+                self._cache.set(key, stored[text])
+                return stored[text]
+        
+        result = self._translate_impl(text, source_lang, target_lang)
+        self._remember(key, text, result)
+        if self._memory is not None and result and result != text:
+            self._memory.put_many(key[0], source_lang, target_lang, [(text, result)])
+        return result
     
     def translate_batch(self, texts, source_lang, target_lang):
         """
         Translate multiple texts.
-        Default implementation translates one by one.
+        Duplicates are collapsed and cached texts are answered from memory
+        (then from the disk translation memory, if configured); only the
+        remaining unique texts are passed to the service in a single batch
+        call, and results are scattered back to every position. Cues with
+        nothing translatable are returned unchanged without being sent.
+        """
+        unique, positions = self._dedup_batch(texts)
+        results = [None] * len(texts)
+        pending = []
+        
+        for text in unique:
+            if not text or _NO_TRANSLATE.match(text):
+                for i in positions[text]:
+                    results[i] = text
+                continue
+            cached = self._cache.get(self._cache_key(text, source_lang, target_lang))
+            if cached is None:
+                pending.append(text)
+                continue
+            for i in positions[text]:
+                results[i] = cached
+        
+        service = self._service_id()
+        if pending and self._memory is not None:
+            stored = self._memory.get_many(service, source_lang, target_lang, pending)
+            if stored:
+                for text, value in stored.items():
+                    self._cache.set(self._cache_key(text, source_lang, target_lang), value)
+                    for i in positions[text]:
+                        results[i] = value
+                pending = [t for t in pending if t not in stored]
+        
+        if pending:
+            if self.pack_short_lines:
+                translated = self._translate_packed(pending, source_lang, target_lang)
+            else:
+                translated = self._translate_batch_impl(pending, source_lang, target_lang)
+            new_pairs = []
+            for n, text in enumerate(pending):
+                value = translated[n] if n < len(translated) else text
+                self._remember(self._cache_key(text, source_lang, target_lang), text, value)
+                if value and value != text:
+                    new_pairs.append((text, value))
+                for i in positions[text]:
+                    results[i] = value
+            if self._memory is not None:
+                self._memory.put_many(service, source_lang, target_lang, new_pairs)
+        
+        return results
+    
+    def _complete_missing(self, texts, translated, source_lang, target_lang):
+        """Request cues missing from a batch reply again as one smaller
+        batch. If nothing usable came back the batch is halved instead, so
+        repeated failures narrow down to single cues."""
+        missing = [i for i, t in enumerate(translated) if t is None]
+        if not missing:
+            return translated
+        if len(texts) == 1:
+            return list(texts)
+        
+        self._log(f"{len(missing)}/{len(texts)} cues missing from reply, requesting them again",
+                  xbmc.LOGWARNING)
+        if len(missing) == len(texts):
+            half = len(missing) // 2
+            parts = (missing[:half], missing[half:])
+        else:
+            parts = (missing,)
+        for part in parts:
+            try:
+                result = self._translate_batch_impl([texts[i] for i in part], source_lang, target_lang)
+            except TranslationError:
+                result = ()
+            for n, i in enumerate(part):
+                translated[i] = result[n] if n < len(result) and result[n] else texts[i]
+        return translated
+    
+    def _translate_packed(self, texts, source_lang, target_lang):
+        """Translate texts with runs of short cues sent as one newline-joined
+        text each. Groups whose reply doesn't split back into the same number
+        of lines are translated again cue by cue."""
+        units, groups = _pack_short_lines(texts)
+        if len(units) == len(texts):
+            return self._translate_batch_impl(texts, source_lang, target_lang)
+        
+        translated = self._translate_batch_impl(units, source_lang, target_lang)
+        results = list(texts)
+        retry = []
+        for n, positions in enumerate(groups):
+            value = translated[n] if n < len(translated) else None
+            if len(positions) == 1:
+                if value:
+                    results[positions[0]] = value
+                continue
+            parts = value.split('\n') if value else ()
+            if len(parts) == len(positions):
+                for i, part in zip(positions, parts):
+                    results[i] = part.strip()
+            else:
+                retry.extend(positions)
+        
+        if retry:
+            self._log(f"{len(retry)} packed cues didn't split back, translating them individually",
+                      xbmc.LOGWARNING)
+            try:
+                again = self._translate_batch_impl([texts[i] for i in retry], source_lang, target_lang)
+            except Exception:
+                again = ()
+            for i, value in zip(retry, again):
+                if value:
+                    results[i] = value
+        return results
+    
+    @staticmethod
+    def _dedup_batch(texts):
         """
-        return [self.translate(text, source_lang, target_lang) for text in texts]
+        Collapse duplicate texts.
+        
+        Returns:
+            (unique texts in first-seen order, dict of text -> positions)
+        """
+        positions = {}
+        for i, text in enumerate(texts):
+            positions.setdefault(text, []).append(i)
+        return list(positions), positions
+    
+    def _translate_impl(self, text, source_lang, target_lang):
+        """Service-specific single text translation."""
+        raise NotImplementedError
+    
+    def _translate_batch_impl(self, texts, source_lang, target_lang):
+        """
+        Service-specific batch translation.
+        Default implementation translates one text per request, running up
+        to `concurrency` requests at once (socket reads release the GIL).
+        Cues whose request failed keep their original text; if every
+        request failed, the error is raised.
+        """
+        def attempt(text):
+            try:
+                return self._translate_impl(text, source_lang, target_lang), None
+            except Exception as e:
+                return text, e
+        
+        workers = min(self.concurrency, len(texts))
+        if workers <= 1:
+            outcomes = [attempt(text) for text in texts]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(attempt, texts))
+        return self._collect_outcomes(outcomes)
+    
+    def _collect_outcomes(self, outcomes):
+        """
+        Merge per-cue (result, error) pairs into a batch result.
+        
+        Raises:
+            The first error, when no cue was translated
+        """
+        errors = [e for _, e in outcomes if e is not None]
+        if errors:
+            if len(errors) == len(outcomes):
+                raise errors[0]
+            self._log(f"{len(errors)}/{len(outcomes)} cues failed, keeping their original text",
+                      xbmc.LOGWARNING)
+        return [result for result, _ in outcomes]
+    
+    def _translate_chunks(self, chunks, translate_chunk):
+        """
+        Translate chunks concurrently.
+        Returns the per-chunk results flattened in input order.
+        """
+        if not chunks:
+            return []
+        if len(chunks) == 1:
+            return translate_chunk(chunks[0])
+        
+        workers = min(self.concurrency, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [text for chunk in executor.map(translate_chunk, chunks) for text in chunk]
+    
+    def _cache_key(self, text, source_lang, target_lang):
+        """Build the translation cache key for a text."""
+        return (self._service_id(), source_lang, target_lang, text)
+    
+    def _remember(self, key, text, result):
+        """Cache a translation result.
+        
+        Results identical to the input are not cached: most services echo
+        the original text back on failure, and that must not stick.
+        """
+        if result and result != text:
+            self._cache.set(key, result)
+    
+    def cancel(self):
+        """Cut short request waits and refuse new requests, e.g. when the
+        translation job is cancelled."""
+        self._cancelled.set()
+    
+    def _throttle(self):
+        """
+        Wait out what is left of the request interval since the previous
+        request started (time spent on that request counts towards it),
+        and any Retry-After the service asked for. The start time is
+        reserved under the lock; the wait itself happens outside it.
+        
+        Raises:
+            TranslationError: if cancelled or Kodi shuts down meanwhile
+        """
+        with self._throttle_lock:
+            now = time.monotonic()
+            start = max(self._last_request + self._request_interval, self._not_before, now)
+            self._last_request = start
+        if start > now and self._wait(start - now):
+            raise TranslationError("Cancelled while waiting to send a request")
+    
+    def _wait(self, delay):
+        """
+        Sleep for delay seconds, in slices that check for cancel() and
+        Kodi shutdown.
+        
+        Returns:
+            True if the wait was cut short
+        """
+        monitor = xbmc.Monitor()
+        deadline = time.monotonic() + delay
+        while not self._cancelled.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if monitor.waitForAbort(min(remaining, _WAIT_SLICE)):
+                return True
+        return True
+    
+    def _adapt_interval(self, error=None):
+        """Additive-increase/multiplicative-decrease of the request rate:
+        back off on HTTP 429, speed up again on success."""
+        if error is None:
+            if self._request_interval > self.min_request_interval:
+                with self._throttle_lock:
+                    self._request_interval = max(self.min_request_interval,
+                                                 self._request_interval - _RATE_LIMIT_STEP)
+            return
+        
+        limited, retry_after = _rate_limit_info(error)
+        if not limited:
+            return
+        with self._throttle_lock:
+            self._request_interval = min(max(self._request_interval * 2, _RATE_LIMIT_MIN_INTERVAL),
+                                         _RATE_LIMIT_MAX_INTERVAL)
+            if retry_after:
+                retry_after = min(retry_after, _RATE_LIMIT_MAX_INTERVAL)
+                self._not_before = time.monotonic() + retry_after
+        self._log(f"Rate limited, spacing requests {self._request_interval:.1f}s"
+                  + (f" (Retry-After {retry_after:g}s)" if retry_after else ''), xbmc.LOGWARNING)
     
     def _request(self, url, data=None, headers=None, method='POST'):
-        """Make HTTP request."""
+        """Make HTTP request. Uses the instance default headers unless
+        headers are given; the passed dict is never mutated. At most
+        `concurrency` requests run at once.
+        
+        Raises:
+            TranslationError: after cancel()
+        """
+        if self._cancelled.is_set():
+            raise TranslationError("Translation cancelled")
+        if self._request_interval or self._not_before:
+            self._throttle()
+        try:
+            with self._request_slots:
+                result = self._send(url, data, headers, method)
+        except Exception as e:
+            self._adapt_interval(e)
+            self._log(f"Request error: {e}", xbmc.LOGERROR)
+            limited, retry_after = _rate_limit_info(e)
+            if limited:
+                raise RateLimitError(f"Rate limited (HTTP 429): {e}", retry_after) from e
+            raise
+        self._adapt_interval()
+        return result
+    
+    def _send(self, url, data, headers, method):
+        """Encode the body and send it over the best available client."""
         if headers is None:
-            headers = {}
+            headers = self._default_headers
         
-        if data and isinstance(data, dict):
-            data = json.dumps(data).encode('utf-8')
-            headers['Content-Type'] = 'application/json'
+        if data and isinstance(data, (dict, list)):
+            data = _jdumps(data)
+            if 'Content-Type' not in headers:
+                headers = {**headers, 'Content-Type': 'application/json'}
         elif data and isinstance(data, str):
             data = data.encode('utf-8')
         
+        if self._client is not None:
+            with self._client.stream(method, url, content=data, headers=headers,
+                                     timeout=self.timeout) as response:
+                response.raise_for_status()
+                body = bytearray()
+                for chunk in response.iter_bytes(_READ_CHUNK):
+                    body.extend(chunk)
+            return _jloads(body)
+        
+        if self._session is not None:
+            with self._session.request(method, url, data=data, headers=headers,
+                                       timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                body = bytearray()
+                for chunk in response.iter_content(_READ_CHUNK):
+                    body.extend(chunk)
+            return _jloads(body)
+        
         req = urllib.request.Request(url, data=data, headers=headers, method=method)
         
-        try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                return json.loads(response.read().decode('utf-8'))
-        except Exception as e:
-            self._log(f"Request error: {e}", xbmc.LOGERROR)
-            raise
+        with _OPENER.open(req, timeout=self.timeout) as response:
+            return _jloads(_read_body(response))
     
     def _log(self, message, level=xbmc.LOGINFO):
         """Log message."""
@@ -114,8 +826,9 @@ class BaseTranslator:
 class DeepLTranslator(BaseTranslator):
     """DeepL Translation API with full Pro features."""
     
-    # Languages that support formality
-    FORMALITY_LANGS = {'DE', 'FR', 'IT', 'ES', 'NL', 'PL', 'PT-PT', 'PT-BR', 'RU', 'SV', 'DA', 'JA'}
+    use_http2 = True
+    billed = True
+    uses_media_context = True
     
     def __init__(self, config):
         super().__init__(config)
@@ -128,51 +841,34 @@ class DeepLTranslator(BaseTranslator):
             self.base_url = 'https://api-free.deepl.com/v2'
         else:
             self.base_url = 'https://api.deepl.com/v2'
+        
+        self._default_headers = {
+            'Authorization': f'DeepL-Auth-Key {self.api_key}',
+            'Content-Type': 'application/json'
+        }
     
-    def translate(self, text, source_lang, target_lang):
+    def _translate_impl(self, text, source_lang, target_lang):
         """Translate text using DeepL."""
         if not self.api_key:
             raise ValueError("DeepL API key required")
         
-        result = self.translate_batch([text], source_lang, target_lang)
+        # One cue needs no chunking or thread pool - send it directly
+        result = self._translate_batch_single([text], source_lang, target_lang)
         return result[0] if result else text
     
     # DeepL API limit: ~128KB per request. Stay well under.
     MAX_REQUEST_BYTES = 100_000
 
-    def translate_batch(self, texts, source_lang, target_lang):
+    def _translate_batch_impl(self, texts, source_lang, target_lang):
         """Translate multiple texts with full DeepL Pro features.
-        Automatically chunks large requests to avoid 413 errors."""
+        Large batches are split into chunks (max 50 texts / ~100KB) that
+        are sent concurrently to avoid 413 errors."""
         if not self.api_key:
             raise ValueError("DeepL API key required")
         
-        # Check total size — if too large, split into chunks
-        total_size = sum(len(t.encode('utf-8')) for t in texts)
-        if total_size > self.MAX_REQUEST_BYTES:
-            return self._translate_batch_chunked(texts, source_lang, target_lang)
-        
-        return self._translate_batch_single(texts, source_lang, target_lang)
-
-    def _translate_batch_chunked(self, texts, source_lang, target_lang):
-        """Split large batches into smaller chunks that fit within API limits."""
-        results = []
-        chunk = []
-        chunk_size = 0
-        
-        for text in texts:
-            text_size = len(text.encode('utf-8'))
-            if chunk_size + text_size > self.MAX_REQUEST_BYTES and chunk:
-                # Translate current chunk
-                results.extend(self._translate_batch_single(chunk, source_lang, target_lang))
-                chunk = []
-                chunk_size = 0
-            chunk.append(text)
-            chunk_size += text_size
-        
-        if chunk:
-            results.extend(self._translate_batch_single(chunk, source_lang, target_lang))
-        
-        return results
+        chunks = list(_chunked(texts, DEEPL_MAX_TEXTS, self.MAX_REQUEST_BYTES, _utf8_len))
+        return self._translate_chunks(
+            chunks, lambda chunk: self._translate_batch_single(chunk, source_lang, target_lang))
 
     def _translate_batch_single(self, texts, source_lang, target_lang):
         """Translate a single batch of texts via DeepL API."""
@@ -194,7 +890,7 @@ class DeepLTranslator(BaseTranslator):
             data['source_lang'] = source
         
         # Formality for supported languages
-        if self.formality != 'default' and target in self.FORMALITY_LANGS:
+        if self.formality != 'default' and target in _DEEPL_FORMALITY_LANGS:
             data['formality'] = self.formality
         
         # Glossary
@@ -206,37 +902,31 @@ class DeepLTranslator(BaseTranslator):
         if context_str:
             data['context'] = context_str
         
-        headers = {
-            'Authorization': f'DeepL-Auth-Key {self.api_key}'
-        }
-        
         try:
-            response = self._request(f'{self.base_url}/translate', data, headers)
-            return [t['text'] for t in response.get('translations', [])]
+            response = self._request(f'{self.base_url}/translate', data)
+            return list(map(itemgetter('text'), response.get('translations', [])))
         except Exception as e:
             self._log(f"DeepL error: {e}", xbmc.LOGERROR)
-            return texts
+            raise _service_error('DeepL', e)
     
     def _map_language(self, lang):
         """Map language code to DeepL format."""
-        mapping = {
-            'en': 'EN', 'sv': 'SV', 'de': 'DE', 'fr': 'FR',
-            'es': 'ES', 'it': 'IT', 'nl': 'NL', 'pl': 'PL',
-            'pt': 'PT-PT', 'ru': 'RU', 'ja': 'JA', 'zh': 'ZH',
-            'da': 'DA', 'fi': 'FI', 'no': 'NB', 'ko': 'KO'
-        }
-        return mapping.get(lang.lower(), lang.upper())
+        return _DEEPL_LANG_MAP.get(lang.lower(), lang.upper())
 
 
 class LibreTranslateTranslator(BaseTranslator):
     """LibreTranslate API (self-hosted or public instances)."""
     
+    packs_short_lines = True
+    # One request per cue; public instances throttle bursts
+    max_concurrency = 2
+    
     def __init__(self, config):
         super().__init__(config)
         self.base_url = config.get('url', 'https://libretranslate.com').rstrip('/')
         self.api_key = config.get('api_key', '')
     
-    def translate(self, text, source_lang, target_lang):
+    def _translate_impl(self, text, source_lang, target_lang):
         """Translate text using LibreTranslate."""
         data = {
             'q': text,
@@ -253,62 +943,78 @@ class LibreTranslateTranslator(BaseTranslator):
             return response.get('translatedText', text)
         except Exception as e:
             self._log(f"LibreTranslate error: {e}", xbmc.LOGERROR)
-            return text
+            raise _service_error('LibreTranslate', e)
 
 
 class MyMemoryTranslator(BaseTranslator):
     """MyMemory Translation API (free, rate-limited)."""
     
+    packs_short_lines = True
+    # Free tier rate-limits per IP; keep few requests in flight
+    max_concurrency = 2
+    
     def __init__(self, config):
         super().__init__(config)
         self.base_url = 'https://api.mymemory.translated.net'
         self.email = config.get('email', '')  # Optional, increases rate limit
+        # URL-encoded langpair/email query string per (source, target)
+        self._query_cache = {}
     
-    def translate(self, text, source_lang, target_lang):
+    def _translate_impl(self, text, source_lang, target_lang):
         """Translate text using MyMemory."""
         # MyMemory doesn't support 'auto' - default to English
         source = source_lang if source_lang and source_lang != 'auto' else 'en'
-        lang_pair = f'{source}|{target_lang}'
         
-        params = {
-            'q': text,
-            'langpair': lang_pair
-        }
+        key = (source, target_lang)
+        base_query = self._query_cache.get(key)
+        if base_query is None:
+            base_params = {'langpair': f'{source}|{target_lang}'}
+            if self.email:
+                base_params['de'] = self.email
+            base_query = self._query_cache.setdefault(
+                key, f'{self.base_url}/get?{urllib.parse.urlencode(base_params)}&q=')
         
-        if self.email:
-            params['de'] = self.email
-        
-        url = f'{self.base_url}/get?{urllib.parse.urlencode(params)}'
+        url = base_query + urllib.parse.quote_plus(text)
         
         try:
             response = self._request(url, method='GET')
             return response.get('responseData', {}).get('translatedText', text)
         except Exception as e:
             self._log(f"MyMemory error: {e}", xbmc.LOGERROR)
-            return text
+            raise _service_error('MyMemory', e)
 
 
 class GoogleTranslator(BaseTranslator):
     """Google Cloud Translation API."""
     
+    use_http2 = True
+    billed = True
+    
     def __init__(self, config):
         super().__init__(config)
         self.api_key = config.get('api_key', '')
         self.base_url = 'https://translation.googleapis.com/language/translate/v2'
     
-    def translate(self, text, source_lang, target_lang):
+    def _translate_impl(self, text, source_lang, target_lang):
         """Translate text using Google Cloud Translation."""
         if not self.api_key:
             raise ValueError("Google API key required")
         
-        result = self.translate_batch([text], source_lang, target_lang)
+        # One cue needs no chunking or thread pool - send it directly
+        result = self._translate_chunk([text], source_lang, target_lang)
         return result[0] if result else text
     
-    def translate_batch(self, texts, source_lang, target_lang):
-        """Translate multiple texts."""
+    def _translate_batch_impl(self, texts, source_lang, target_lang):
+        """Translate multiple texts in concurrent chunks of up to 128 segments."""
         if not self.api_key:
             raise ValueError("Google API key required")
         
+        chunks = list(_chunked(texts, GOOGLE_MAX_SEGMENTS))
+        return self._translate_chunks(
+            chunks, lambda chunk: self._translate_chunk(chunk, source_lang, target_lang))
+    
+    def _translate_chunk(self, texts, source_lang, target_lang):
+        """Translate a single chunk via the Google API."""
         data = {
             'q': texts,
             'target': target_lang,
@@ -325,31 +1031,46 @@ class GoogleTranslator(BaseTranslator):
             return [t.get('translatedText', texts[i]) for i, t in enumerate(translations)]
         except Exception as e:
             self._log(f"Google Translate error: {e}", xbmc.LOGERROR)
-            return texts
+            raise _service_error('Google Translate', e)
 
 
 class MicrosoftTranslator(BaseTranslator):
     """Microsoft Azure Translator API."""
     
+    use_http2 = True
+    billed = True
+    
     def __init__(self, config):
         super().__init__(config)
         self.api_key = config.get('api_key', '')
         self.region = config.get('region', 'westeurope')
         self.base_url = 'https://api.cognitive.microsofttranslator.com/translate'
+        self._default_headers = {
+            'Ocp-Apim-Subscription-Key': self.api_key,
+            'Ocp-Apim-Subscription-Region': self.region,
+            'Content-Type': 'application/json'
+        }
     
-    def translate(self, text, source_lang, target_lang):
+    def _translate_impl(self, text, source_lang, target_lang):
         """Translate text using Microsoft Translator."""
         if not self.api_key:
             raise ValueError("Microsoft API key required")
         
-        result = self.translate_batch([text], source_lang, target_lang)
+        # One cue needs no chunking or thread pool - send it directly
+        result = self._translate_chunk([text], source_lang, target_lang)
         return result[0] if result else text
     
-    def translate_batch(self, texts, source_lang, target_lang):
-        """Translate multiple texts."""
+    def _translate_batch_impl(self, texts, source_lang, target_lang):
+        """Translate multiple texts in concurrent chunks (max 100 items / 50 000 chars)."""
         if not self.api_key:
             raise ValueError("Microsoft API key required")
         
+        chunks = list(_chunked(texts, MS_MAX_ARRAY, MS_MAX_CHARS))
+        return self._translate_chunks(
+            chunks, lambda chunk: self._translate_chunk(chunk, source_lang, target_lang))
+    
+    def _translate_chunk(self, texts, source_lang, target_lang):
+        """Translate a single chunk via the Microsoft API."""
         params = {
             'api-version': '3.0',
             'to': target_lang
@@ -360,105 +1081,101 @@ class MicrosoftTranslator(BaseTranslator):
         
         url = f'{self.base_url}?{urllib.parse.urlencode(params)}'
         
-        headers = {
-            'Ocp-Apim-Subscription-Key': self.api_key,
-            'Ocp-Apim-Subscription-Region': self.region
-        }
-        
         data = [{'Text': text} for text in texts]
         
         try:
-            response = self._request(url, data, headers)
+            response = self._request(url, data)
             return [r['translations'][0]['text'] for r in response]
         except Exception as e:
             self._log(f"Microsoft Translator error: {e}", xbmc.LOGERROR)
-            return texts
+            raise _service_error('Microsoft Translator', e)
 
 
 class LingvaTranslator(BaseTranslator):
     """Lingva Translate (free, open-source Google Translate frontend)."""
     
+    packs_short_lines = True
+    # Public instances rate-limit hard; batches handle 429 backoff serially
+    max_concurrency = 1
+    # ~50 req/min to stay under the public instance limit
+    min_request_interval = 1.2
+    
     def __init__(self, config):
         super().__init__(config)
         self.base_url = config.get('url', 'https://lingva.ml').rstrip('/')
-        self._consecutive_429 = 0
+        # URL prefix per (source, target) so only the cue is quoted per call
+        self._prefix_cache = {}
     
-    def translate(self, text, source_lang, target_lang):
+    def _translate_impl(self, text, source_lang, target_lang):
         """Translate a single text using Lingva."""
         source = source_lang if source_lang and source_lang != 'auto' else 'en'
-        encoded_text = urllib.parse.quote(text)
-        url = f'{self.base_url}/api/v1/{source}/{target_lang}/{encoded_text}'
+        key = (source, target_lang)
+        prefix = self._prefix_cache.get(key) or self._prefix_cache.setdefault(
+            key, f'{self.base_url}/api/v1/{source}/{target_lang}/')
+        # safe='' so a '/' in the cue can't split the path
+        url = prefix + urllib.parse.quote(text, safe='')
         
         try:
             response = self._request(url, method='GET')
             translation = response.get('translation', '')
             if translation:
-                self._consecutive_429 = 0
                 return translation
             self._log(f"Lingva returned empty for: {text[:80]}", xbmc.LOGWARNING)
             return text
         except Exception as e:
-            err_str = str(e)
-            if '429' in err_str:
-                self._consecutive_429 += 1
             self._log(f"Lingva error for '{text[:50]}': {e}", xbmc.LOGERROR)
             raise  # Re-raise so batch handler can do backoff
     
-    def translate_batch(self, texts, source_lang, target_lang):
-        """Translate texts one-by-one with rate-limit handling."""
-        import time
-        
-        results = []
+    def _translate_batch_impl(self, texts, source_lang, target_lang):
+        """Translate texts one-by-one with rate-limit handling. Requests
+        are spaced in _request, which also backs off after a 429."""
+        outcomes = []
         for i, text in enumerate(texts):
-            # Backoff if rate-limited
-            if self._consecutive_429 > 0:
-                backoff = min(2 ** min(self._consecutive_429, 5), 30)
-                self._log(f"Rate limit backoff: {backoff}s (429 x{self._consecutive_429})")
-                time.sleep(backoff)
-            
             try:
-                result = self.translate(text, source_lang, target_lang)
-                results.append(result)
+                outcomes.append((self._translate_impl(text, source_lang, target_lang), None))
             except Exception as e:
-                if '429' in str(e):
-                    # Wait and retry once
-                    backoff = min(2 ** min(self._consecutive_429, 5), 30)
-                    self._log(f"429 on entry {i+1}/{len(texts)}, waiting {backoff}s and retrying")
-                    time.sleep(backoff)
+                if isinstance(e, RateLimitError):
+                    # Retry once; _request waits out the backoff first
+                    self._log(f"429 on entry {i+1}/{len(texts)}, retrying")
                     try:
-                        result = self.translate(text, source_lang, target_lang)
-                        results.append(result)
-                    except:
-                        results.append(text)  # Give up on this entry
+                        outcomes.append((self._translate_impl(text, source_lang, target_lang), None))
+                    except Exception as retry_error:
+                        outcomes.append((text, retry_error))  # Give up on this entry
                 else:
-                    results.append(text)
-            
-            # Small delay between requests to avoid rate limiting
-            # ~200ms = max ~5 req/sec = 300 req/min (Lingva allows ~50/min)
-            if i < len(texts) - 1:
-                time.sleep(1.2)  # ~50 req/min to stay under Lingva limit
+                    outcomes.append((text, e))
         
-        return results
+        return self._collect_outcomes(outcomes)
 
 
 class OpenAITranslator(BaseTranslator):
     """OpenAI GPT Translation (high-quality, context-aware)."""
     
+    use_http2 = True
+    billed = True
+    uses_media_context = True
+    
     def __init__(self, config):
         super().__init__(config)
         self.api_key = config.get('api_key', '')
         self.model = config.get('model', 'gpt-4o-mini')
         self.base_url = config.get('base_url', 'https://api.openai.com/v1').rstrip('/')
+        # OpenAI-compatible servers don't all accept response_format
+        self.json_mode = config.get('json_mode',
+                                    urllib.parse.urlsplit(self.base_url).hostname == 'api.openai.com')
+        self._default_headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json'
+        }
     
-    def translate(self, text, source_lang, target_lang):
+    def _translate_impl(self, text, source_lang, target_lang):
         """Translate text using OpenAI GPT."""
         if not self.api_key:
             raise ValueError("OpenAI API key required")
         
-        result = self.translate_batch([text], source_lang, target_lang)
+        result = self._translate_batch_impl([text], source_lang, target_lang)
         return result[0] if result else text
     
-    def translate_batch(self, texts, source_lang, target_lang):
+    def _translate_batch_impl(self, texts, source_lang, target_lang):
         """Translate multiple texts using OpenAI with media context."""
         if not self.api_key:
             raise ValueError("OpenAI API key required")
@@ -466,43 +1183,43 @@ class OpenAITranslator(BaseTranslator):
         target_name = self._get_language_name(target_lang)
         source_name = self._get_language_name(source_lang) if source_lang != 'auto' else 'the source language'
         
-        combined = '\n---SUBTITLE_BREAK---\n'.join(texts)
-        
         # Build media-aware system prompt
         media_info = self._build_media_prompt()
         
         system_prompt = f"""You are a professional subtitle translator. Translate the following subtitles from {source_name} to {target_name}.
 {media_info}
+Input is a JSON object {{"cues": [{{"i": <index>, "t": <text>}}, ...]}}.
+Reply with a JSON object of the same shape: one entry per input cue, same "i", translated "t".
 Rules:
-- Preserve the exact number of subtitle entries (separated by ---SUBTITLE_BREAK---)
+- Translate every cue; never merge or split cues
 - Keep translations natural and colloquial, suitable for subtitles
 - Maintain the same tone and style as the original
 - Keep translations concise (subtitles have limited space)
 - Use context from the plot/genre to resolve ambiguous words correctly
 - Character names should NOT be translated
 - Do not add explanations or notes
-- Only output the translations, nothing else"""
+- Only output the JSON object, nothing else"""
         
         data = {
             'model': self.model,
             'messages': [
                 {'role': 'system', 'content': system_prompt},
-                {'role': 'user', 'content': combined}
+                {'role': 'user', 'content': _cues_payload(texts)}
             ],
             'temperature': 0.3
         }
-        
-        headers = {
-            'Authorization': f'Bearer {self.api_key}'
-        }
+        if self.json_mode:
+            data['response_format'] = {'type': 'json_object'}
         
         try:
-            response = self._request(f'{self.base_url}/chat/completions', data, headers)
-            translated = response['choices'][0]['message']['content']
-            return translated.split('\n---SUBTITLE_BREAK---\n')
+            response = self._request(f'{self.base_url}/chat/completions', data)
+            reply = response['choices'][0]['message']['content']
+            translated = _parse_cues(_extract_json(reply), len(texts))
         except Exception as e:
             self._log(f"OpenAI error: {e}", xbmc.LOGERROR)
-            return texts
+            raise _service_error('OpenAI', e)
+        
+        return self._complete_missing(texts, translated, source_lang, target_lang)
     
     def _build_media_prompt(self):
         """Build context section for the system prompt from media metadata."""
@@ -533,34 +1250,36 @@ Rules:
     
     def _get_language_name(self, code):
         """Get full language name from code."""
-        names = {
-            'sv': 'Swedish', 'en': 'English', 'de': 'German', 'fr': 'French',
-            'es': 'Spanish', 'it': 'Italian', 'no': 'Norwegian', 'da': 'Danish',
-            'fi': 'Finnish', 'nl': 'Dutch', 'pl': 'Polish', 'pt': 'Portuguese',
-            'ru': 'Russian', 'ja': 'Japanese', 'zh': 'Chinese', 'ko': 'Korean',
-            'ar': 'Arabic', 'tr': 'Turkish', 'hi': 'Hindi', 'uk': 'Ukrainian'
-        }
-        return names.get(code, code)
+        return _LANG_NAMES.get(code, code)
 
 
 class AnthropicTranslator(BaseTranslator):
     """Anthropic Claude Translation (high-quality, context-aware)."""
     
+    use_http2 = True
+    billed = True
+    uses_media_context = True
+    
     def __init__(self, config):
         super().__init__(config)
         self.api_key = config.get('api_key', '')
         self.model = config.get('model', 'claude-sonnet-4-20250514')
         self.base_url = 'https://api.anthropic.com/v1'
+        self._default_headers = {
+            'x-api-key': self.api_key,
+            'anthropic-version': '2023-06-01',
+            'Content-Type': 'application/json'
+        }
     
-    def translate(self, text, source_lang, target_lang):
+    def _translate_impl(self, text, source_lang, target_lang):
         """Translate text using Claude."""
         if not self.api_key:
             raise ValueError("Anthropic API key required")
         
-        result = self.translate_batch([text], source_lang, target_lang)
+        result = self._translate_batch_impl([text], source_lang, target_lang)
         return result[0] if result else text
     
-    def translate_batch(self, texts, source_lang, target_lang):
+    def _translate_batch_impl(self, texts, source_lang, target_lang):
         """Translate multiple texts using Claude with media context."""
         if not self.api_key:
             raise ValueError("Anthropic API key required")
@@ -568,43 +1287,40 @@ class AnthropicTranslator(BaseTranslator):
         target_name = self._get_language_name(target_lang)
         source_name = self._get_language_name(source_lang) if source_lang != 'auto' else 'the source language'
         
-        combined = '\n---SUBTITLE_BREAK---\n'.join(texts)
-        
         # Build media-aware system prompt
         media_info = self._build_media_prompt()
         
         system_prompt = f"""You are a professional subtitle translator. Translate subtitles from {source_name} to {target_name}.
 {media_info}
+Input is a JSON object {{"cues": [{{"i": <index>, "t": <text>}}, ...]}}.
+Output ONLY a JSON array [{{"i": <index>, "t": <translation>}}, ...] with one entry per input cue, same order.
 Rules:
-- Preserve the exact number of subtitle entries (separated by ---SUBTITLE_BREAK---)
+- Translate every cue; never merge or split cues
 - Keep translations natural and colloquial
 - Maintain tone and style
 - Keep translations concise for subtitle format
 - Use context from the plot/genre to resolve ambiguous words
 - Character names should NOT be translated
-- Output only translations, no explanations"""
+- Output only the JSON array, no explanations"""
         
         data = {
             'model': self.model,
-            'max_tokens': 4096,
+            'max_tokens': _reply_token_budget(texts),
             'system': system_prompt,
             'messages': [
-                {'role': 'user', 'content': combined}
+                {'role': 'user', 'content': _cues_payload(texts)}
             ]
         }
         
-        headers = {
-            'x-api-key': self.api_key,
-            'anthropic-version': '2023-06-01'
-        }
-        
         try:
-            response = self._request(f'{self.base_url}/messages', data, headers)
-            translated = response['content'][0]['text']
-            return translated.split('\n---SUBTITLE_BREAK---\n')
+            response = self._request(f'{self.base_url}/messages', data)
+            reply = response['content'][0]['text']
+            translated = _parse_cues(_extract_json(reply), len(texts))
         except Exception as e:
             self._log(f"Anthropic error: {e}", xbmc.LOGERROR)
-            return texts
+            raise _service_error('Anthropic', e)
+        
+        return self._complete_missing(texts, translated, source_lang, target_lang)
     
     def _build_media_prompt(self):
         """Build context section from media metadata."""
@@ -635,67 +1351,18 @@ Rules:
     
     def _get_language_name(self, code):
         """Get full language name from code."""
-        names = {
-            'sv': 'Swedish', 'en': 'English', 'de': 'German', 'fr': 'French',
-            'es': 'Spanish', 'it': 'Italian', 'no': 'Norwegian', 'da': 'Danish',
-            'fi': 'Finnish', 'nl': 'Dutch', 'pl': 'Polish', 'pt': 'Portuguese',
-            'ru': 'Russian', 'ja': 'Japanese', 'zh': 'Chinese', 'ko': 'Korean',
-            'ar': 'Arabic', 'tr': 'Turkish', 'hi': 'Hindi', 'uk': 'Ukrainian'
-        }
-        return names.get(code, code)
+        return _LANG_NAMES.get(code, code)
 
 
-class ArgosTranslator(BaseTranslator):
-    """Argos Translate (offline, local translation using neural models)."""
-    
-    def __init__(self, config):
-        super().__init__(config)
-        self.package_path = config.get('package_path', '')
-        self._argos_available = None
-    
-    def _check_argos(self):
-        """Check if Argos Translate is available."""
-        if self._argos_available is not None:
-            return self._argos_available
-        
-        try:
-            import argostranslate.package
-            import argostranslate.translate
-            self._argos_available = True
-        except ImportError:
-            self._argos_available = False
-            self._log("Argos Translate not installed. Install with: pip install argostranslate", xbmc.LOGERROR)
-        
-        return self._argos_available
-    
-    def translate(self, text, source_lang, target_lang):
-        """Translate text using Argos Translate (offline)."""
-        if not self._check_argos():
-            return text
-        
-        try:
-            import argostranslate.translate
-            
-            # Get installed languages
-            installed_languages = argostranslate.translate.get_installed_languages()
-            source_l = next((l for l in installed_languages if l.code == source_lang), None)
-            target_l = next((l for l in installed_languages if l.code == target_lang), None)
-            
-            if not source_l or not target_l:
-                self._log(f"Language pair {source_lang}->{target_lang} not installed", xbmc.LOGERROR)
-                return text
-            
-            translation = source_l.get_translation(target_l)
-            if translation:
-                return translation.translate(text)
-            else:
-                self._log(f"No translation available for {source_lang}->{target_lang}", xbmc.LOGERROR)
-                return text
-                
-        except Exception as e:
-            self._log(f"Argos error: {e}", xbmc.LOGERROR)
-            return text
-    
-    def translate_batch(self, texts, source_lang, target_lang):
-        """Translate multiple texts using Argos."""
-        return [self.translate(text, source_lang, target_lang) for text in texts]
+# Service name -> translator class, used by get_translator()
+_TRANSLATORS = MappingProxyType({
+    'deepl': DeepLTranslator,
+    'deepl_free': DeepLTranslator,
+    'libretranslate': LibreTranslateTranslator,
+    'mymemory': MyMemoryTranslator,
+    'google': GoogleTranslator,
+    'microsoft': MicrosoftTranslator,
+    'lingva': LingvaTranslator,
+    'openai': OpenAITranslator,
+    'anthropic': AnthropicTranslator,
+})
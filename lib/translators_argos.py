@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Argos Translate - Offline translator, kept apart from lib.translators so
+argostranslate/CTranslate2 are only imported when the service is used.
+"""
+
+import functools
+import os
+import xbmc
+
+from lib.translators import BaseTranslator, TranslationError
+
+
+@functools.lru_cache(maxsize=None)
+def _load_argos():
+    """Import argostranslate once per process; None if not installed."""
+    # argostranslate reads these when its settings module is imported.
+    # Let CTranslate2 spread each cue's inference across all cores; a
+    # process pool isn't an option inside Kodi's embedded interpreter.
+    os.environ.setdefault('ARGOS_INTRA_THREADS', str(os.cpu_count() or 1))
+    os.environ.setdefault('ARGOS_INTER_THREADS', '1')
+    try:
+        import argostranslate.package
+        import argostranslate.translate
+        return argostranslate.translate
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _installed_languages():
+    """Installed Argos languages keyed by code, read from disk once per process."""
+    return {l.code: l for l in _load_argos().get_installed_languages()}
+
+
+class ArgosTranslator(BaseTranslator):
+    """Argos Translate (offline, local translation using neural models)."""
+    
+    # CPU-bound and already multi-threaded inside CTranslate2
+    max_concurrency = 1
+    
+    def __init__(self, config):
+        super().__init__(config)
+        self.package_path = config.get('package_path', '')
+    
+    def _check_argos(self):
+        """Check if Argos Translate is available."""
+        if _load_argos() is not None:
+            return True
+        self._log("Argos Translate not installed. Install with: pip install argostranslate", xbmc.LOGERROR)
+        return False
+    
+    def _translate_impl(self, text, source_lang, target_lang):
+        """Translate text using Argos Translate (offline)."""
+        if not self._check_argos():
+            raise TranslationError("Argos Translate not installed")
+        
+        try:
+            installed_languages = _installed_languages()
+            source_l = installed_languages.get(source_lang)
+            target_l = installed_languages.get(target_lang)
+            
+            if not source_l or not target_l:
+                self._log(f"Language pair {source_lang}->{target_lang} not installed", xbmc.LOGERROR)
+                raise TranslationError(f"Argos language pair {source_lang}->{target_lang} not installed")
+            
+            translation = source_l.get_translation(target_l)
+            if translation:
+                return translation.translate(text)
+            else:
+                self._log(f"No translation available for {source_lang}->{target_lang}", xbmc.LOGERROR)
+                raise TranslationError(f"No Argos translation for {source_lang}->{target_lang}")
+                
+        except TranslationError:
+            raise
+        except Exception as e:
+            self._log(f"Argos error: {e}", xbmc.LOGERROR)
+            raise TranslationError(f"Argos error: {e}") from e
+    
+    def _translate_batch_impl(self, texts, source_lang, target_lang):
+        """Translate multiple texts using Argos, one cue at a time."""
+        outcomes = []
+        for text in texts:
+            try:
+                outcomes.append((self._translate_impl(text, source_lang, target_lang), None))
+            except TranslationError as e:
+                outcomes.append((text, e))
+        return self._collect_outcomes(outcomes)
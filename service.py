@@ -9,11 +9,21 @@ import xbmc
 import xbmcaddon
 import xbmcgui
 import xbmcvfs
+import functools
+import glob
 import json
 import os
-import hashlib
+import importlib.util
+import sys
+import threading
 import time
 
+# orjson parses JSON-RPC replies faster when installed (not bundled with Kodi)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Lazy imports to avoid crashes at startup
 SubtitleExtractor = None
 get_translator = None
@@ -32,9 +42,55 @@ _addon = None
 _addon_path = None
 _addon_data = None
 _cache_path = None
+_translation_memory = None
+_negative_cache = None
+# Setting values read through get_setting*(), cleared on settings change
+_settings_cache = {}
+_http_session = None
 _error_reporter = None
 _debug_logger = None
 
+# Default translation batches kept in flight at once (network-bound, so
+# threads overlap the round trips). The translation_concurrency setting
+# overrides it; translators can lower it via max_concurrency.
+BATCH_CONCURRENCY = 4
+# Minimum seconds between progress dialog redraws during translation
+PROGRESS_UPDATE_INTERVAL = 0.2
+_fail_count_lock = threading.Lock()
+# Services whose failure counts are kept for log throttling (LRU bound)
+_MAX_FAIL_COUNT_KEYS = 64
+
+
+# 3-letter ISO 639-2 codes and English language names -> 2-letter code
+LANG_ALIAS = {
+    'eng': 'en', 'swe': 'sv', 'nor': 'no', 'dan': 'da', 'fin': 'fi',
+    'deu': 'de', 'ger': 'de', 'fra': 'fr', 'fre': 'fr', 'spa': 'es',
+    'ita': 'it', 'por': 'pt', 'pol': 'pl', 'nld': 'nl', 'dut': 'nl',
+    'rus': 'ru', 'ukr': 'uk', 'jpn': 'ja', 'zho': 'zh', 'chi': 'zh',
+    'nob': 'no', 'kor': 'ko', 'ara': 'ar', 'tur': 'tr', 'hin': 'hi',
+    'tha': 'th', 'vie': 'vi', 'ind': 'id', 'gre': 'el', 'ell': 'el',
+    'cze': 'cs', 'ces': 'cs', 'rum': 'ro', 'ron': 'ro', 'hun': 'hu',
+    'heb': 'he', 'may': 'ms', 'msa': 'ms', 'tam': 'ta', 'tel': 'te',
+    'tgl': 'tl',
+    'english': 'en', 'swedish': 'sv', 'norwegian': 'no', 'danish': 'da',
+    'finnish': 'fi', 'german': 'de', 'french': 'fr', 'spanish': 'es',
+    'italian': 'it', 'portuguese': 'pt', 'polish': 'pl', 'dutch': 'nl',
+    'russian': 'ru', 'ukrainian': 'uk', 'japanese': 'ja', 'chinese': 'zh',
+    'korean': 'ko', 'arabic': 'ar', 'turkish': 'tr', 'hindi': 'hi',
+    'thai': 'th', 'vietnamese': 'vi', 'indonesian': 'id', 'greek': 'el',
+    'czech': 'cs', 'romanian': 'ro', 'hungarian': 'hu', 'hebrew': 'he',
+    'malay': 'ms', 'tamil': 'ta', 'telugu': 'te', 'filipino': 'fil',
+    'tagalog': 'tl'
+}
+
+
+@functools.lru_cache(maxsize=256)
+def normalize_lang(code):
+    """Normalize a language code: 'sv_SE', 'sv-se', 'swe', 'Swedish' -> 'sv'.
+    Results are interned, so comparing them is mostly an identity check."""
+    code = code.lower().replace('-', '_').partition('_')[0]
+    return sys.intern(LANG_ALIAS.get(code, code))
+
 
 def get_addon():
     """Get addon instance (lazy loaded)."""
@@ -73,8 +129,8 @@ def get_addon_data():
     global _addon_data
     if _addon_data is None:
         _addon_data = xbmcvfs.translatePath(get_addon().getAddonInfo('profile'))
-        if not xbmcvfs.exists(_addon_data):
-            xbmcvfs.mkdirs(_addon_data)
+        # mkdirs succeeds if the directory already exists
+        xbmcvfs.mkdirs(_addon_data)
     return _addon_data
 
 
@@ -83,40 +139,122 @@ def get_cache_path():
     global _cache_path
     if _cache_path is None:
         _cache_path = os.path.join(get_addon_data(), 'cache')
-        if not xbmcvfs.exists(_cache_path):
-            xbmcvfs.mkdirs(_cache_path)
+        xbmcvfs.mkdirs(_cache_path)
     return _cache_path
 
 
+def get_translation_memory():
+    """Get the shared disk translation memory (lazy loaded)."""
+    global _translation_memory
+    if _translation_memory is None:
+        from lib.translation_memory import TranslationMemory
+        _translation_memory = TranslationMemory(get_addon_data())
+    # Entries expire together with cached subtitle files
+    _translation_memory.max_age = get_setting_int('cache_days') * 24 * 60 * 60
+    return _translation_memory
+
+
+def get_negative_cache():
+    """Get the filter of streams that recently failed to extract (lazy loaded)."""
+    global _negative_cache
+    if _negative_cache is None:
+        from lib.negative_cache import NegativeCache
+        _negative_cache = NegativeCache(get_addon_data())
+    return _negative_cache
+
+
+def get_http_session():
+    """
+    Get the requests session shared by all translators (lazy loaded).
+    
+    Keeps connections alive across batches and fallbacks and retries
+    transient errors. Returns None if requests isn't available, in which
+    case translators fall back to urllib.
+    """
+    global _http_session
+    if _http_session is None:
+        try:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+        except ImportError:
+            return None
+        
+        retry_args = {
+            'total': 3,
+            'backoff_factor': 0.3,
+            # 429 is left to the translators, which space their requests
+            # out; retrying it here would sleep on Retry-After in the worker
+            'status_forcelist': (500, 502, 503, 504),
+            'respect_retry_after_header': False,
+            'raise_on_status': False
+        }
+        try:
+            retry = Retry(allowed_methods=frozenset(['POST', 'GET']), **retry_args)
+        except TypeError:
+            # urllib3 < 1.26
+            retry = Retry(method_whitelist=frozenset(['POST', 'GET']), **retry_args)
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry)
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _http_session = session
+    return _http_session
+
+
+def _lazy_module(name):
+    """
+    Import a module lazily: its body only runs on first attribute access,
+    so playback that never needs a translation doesn't pay for it.
+    """
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.find_spec(name)
+        loader = importlib.util.LazyLoader(spec.loader)
+        spec.loader = loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        loader.exec_module(module)
+    return module
+
+
+def _lazy_callable(module, attr):
+    """Callable that resolves module.attr on first call."""
+    def call(*args, **kwargs):
+        return getattr(module, attr)(*args, **kwargs)
+    call.__name__ = attr
+    return call
+
+
+# Library entry points bound by init_libraries(): global name -> (module, attribute)
+_LIBRARY_ENTRY_POINTS = {
+    'SubtitleExtractor': ('lib.subtitle_extractor', 'SubtitleExtractor'),
+    'get_translator': ('lib.translators', 'get_translator'),
+    'SubtitleParser': ('lib.subtitle_parser', 'SubtitleParser'),
+    'TranslationProgress': ('lib.progress_dialog', 'TranslationProgress'),
+    'ErrorReporter': ('lib.progress_dialog', 'ErrorReporter'),
+    'DebugLogger': ('lib.progress_dialog', 'DebugLogger'),
+    'show_translate_confirm': ('lib.dialogs', 'show_translate_confirm'),
+    'get_current_thumbnail': ('lib.dialogs', 'get_current_thumbnail'),
+    'get_current_media_title': ('lib.dialogs', 'get_current_media_title'),
+    'show_subtitle_source_dialog': ('lib.dialogs', 'show_subtitle_source_dialog'),
+    'browse_subtitle_file': ('lib.dialogs', 'browse_subtitle_file'),
+}
+
+
 def init_libraries():
-    """Initialize library imports (called from main)."""
-    global SubtitleExtractor, get_translator, SubtitleParser
-    global TranslationProgress, ErrorReporter, DebugLogger
-    global show_translate_confirm, get_current_thumbnail, get_current_media_title
-    global show_subtitle_source_dialog, browse_subtitle_file
-    global _error_reporter, _debug_logger
-    
-    from lib.subtitle_extractor import SubtitleExtractor as SE
-    from lib.translators import get_translator as gt
-    from lib.subtitle_parser import SubtitleParser as SP
-    from lib.progress_dialog import TranslationProgress as TP, ErrorReporter as ER, DebugLogger as DL
-    from lib.dialogs import show_translate_confirm as stc, get_current_thumbnail as gct, get_current_media_title as gcmt, show_subtitle_source_dialog as sssd, browse_subtitle_file as bsf
-    
-    SubtitleExtractor = SE
-    get_translator = gt
-    SubtitleParser = SP
-    TranslationProgress = TP
-    ErrorReporter = ER
-    DebugLogger = DL
-    show_translate_confirm = stc
-    get_current_thumbnail = gct
-    get_current_media_title = gcmt
-    show_subtitle_source_dialog = sssd
-    browse_subtitle_file = bsf
-    
-    # Initialize reporter and logger
-    _error_reporter = ER(get_addon_data())
-    _debug_logger = DL(get_addon_data())
+    """Bind library entry points (on first playback check). The modules
+    are loaded lazily on first use, unless SUBTRANS_EAGER_IMPORT=1 is set
+    in the environment (useful to surface import errors up front)."""
+    if SubtitleExtractor is not None:
+        return
+    
+    eager = os.environ.get('SUBTRANS_EAGER_IMPORT') == '1'
+    bound = {}
+    for name, (module_name, attr) in _LIBRARY_ENTRY_POINTS.items():
+        module = _lazy_module(module_name)
+        bound[name] = getattr(module, attr) if eager else _lazy_callable(module, attr)
+    globals().update(bound)
 
 
 def get_error_reporter():
@@ -124,6 +262,7 @@ def get_error_reporter():
     global _error_reporter
     if _error_reporter is None:
         init_libraries()
+        _error_reporter = ErrorReporter(get_addon_data())
     return _error_reporter
 
 
@@ -132,12 +271,84 @@ def get_debug_logger():
     global _debug_logger
     if _debug_logger is None:
         init_libraries()
+        _debug_logger = DebugLogger(get_addon_data())
     return _debug_logger
 
 
 # Use get_debug_logger() and get_error_reporter() functions
 
 
+class CircuitOpenError(Exception):
+    """Raised instead of calling a service whose circuit breaker is open."""
+
+
+class _CircuitBreaker:
+    """
+    Stops calling a failing service for a while.
+    
+    Closed: calls go through. After THRESHOLD failures in a row the
+    breaker opens and calls fail at once for SLEEP_WINDOW seconds. Then
+    it is half-open: one probe call goes through, closing the breaker on
+    success and reopening it on failure.
+    """
+    
+    THRESHOLD = 5
+    SLEEP_WINDOW = 30
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.fail_count = 0
+        self.opened_at = None
+        self._probing = False
+    
+    def allow(self):
+        """True if a call may be made now."""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self._probing or time.monotonic() - self.opened_at < self.SLEEP_WINDOW:
+                return False
+            self._probing = True
+            return True
+    
+    def record(self, success):
+        """
+        Record the outcome of an allowed call.
+        
+        Returns:
+            'open' or 'closed' when the state changed, else None
+        """
+        with self._lock:
+            self._probing = False
+            if success:
+                self.fail_count = 0
+                if self.opened_at is None:
+                    return None
+                self.opened_at = None
+                return 'closed'
+            
+            self.fail_count += 1
+            if self.opened_at is None and self.fail_count < self.THRESHOLD:
+                return None
+            was_open = self.opened_at is not None
+            self.opened_at = time.monotonic()
+            return None if was_open else 'open'
+
+
+# (service, endpoint URL) -> _CircuitBreaker, kept for the whole session
+_circuit_breakers = {}
+
+
+def _get_circuit_breaker(service, url=None):
+    """Get the shared breaker for a service endpoint."""
+    key = (service, url)
+    breaker = _circuit_breakers.get(key)
+    if breaker is None:
+        with _fail_count_lock:
+            breaker = _circuit_breakers.setdefault(key, _CircuitBreaker())
+    return breaker
+
+
 class SubtitleTranslatorMonitor(xbmc.Monitor):
     """Monitor for Kodi events."""
     
@@ -148,6 +359,12 @@ class SubtitleTranslatorMonitor(xbmc.Monitor):
     def onSettingsChanged(self):
         """Called when addon settings are changed."""
         log("Settings changed, reloading configuration")
+        clear_settings_cache()
+        # The UI language may have changed as well
+        get_string.cache_clear()
+        # A new FFmpeg path may extract streams that failed before
+        if _negative_cache is not None:
+            _negative_cache.clear()
         self.player.reload_settings()
 
 
@@ -159,22 +376,54 @@ class SubtitleTranslatorPlayer(xbmc.Player):
         self.reload_settings()
         self.current_file = None
         self.translation_in_progress = False
+        self._cache_keys = {}
+        # cache_key -> (epoch, path) of the newest cache file seen or written
+        self._cache_index = {}
+        # (video path, external subtitle list) for the current playback
+        self._external_listing = None
+        # service -> failures this session, least recently failed first
+        self._fail_counts = {}
+        # service -> monotonic() time until which it is rate limited
+        self._service_not_before = {}
+        self._monitor = xbmc.Monitor()
+        # Cache directory with trailing separator, resolved once
+        self._cache_prefix = get_cache_path().rstrip('/\\') + os.sep
+        self._cache_glob_prefix = glob.escape(self._cache_prefix)
+        
+        # Drop expired cache files off the startup path
+        threading.Thread(target=self._prune_cache, daemon=True).start()
     
     def reload_settings(self):
         """Reload settings from addon configuration."""
+        if not _settings_cache:
+            load_all_settings()
         self.enabled = get_setting_bool('enabled')
         self.auto_translate = get_setting_bool('auto_translate')
         self.show_notification = get_setting_bool('show_notification')
         self.ask_before_translate = get_setting_bool('ask_before_translate')
-        self.target_language = get_setting('target_language')
-        self.source_language = get_setting('source_language')
+        self.target_language = sys.intern(get_setting('target_language'))
+        self.source_language = sys.intern(get_setting('source_language'))
+        # Normalized once here rather than per stream in the subtitle checks
+        self._target_norm = normalize_lang(self.target_language)
+        self._source_norm = (None if self.source_language.lower() == 'auto'
+                             else normalize_lang(self.source_language))
         self.translation_service = get_setting('translation_service')
         self.cache_translations = get_setting_bool('cache_translations')
         self.cache_days = get_setting_int('cache_days')
         self.save_alongside = get_setting_bool('save_alongside_video')
         self.subtitle_format = get_setting('subtitle_format')
         self.batch_size = get_setting_int('batch_size')
+        self.translation_concurrency = get_setting_int('translation_concurrency') or BATCH_CONCURRENCY
+        self.pack_short_lines = get_setting_bool('pack_short_lines')
         self.debug = get_setting_bool('debug_logging')
+        self.ffmpeg_path = get_setting('ffmpeg_path')
+        # Validated SubtitleExtractor, dropped whenever settings are reloaded
+        self._extractor = None
+        self.request_timeout = get_setting_int('request_timeout')
+        self.enable_fallback = get_setting_bool('enable_fallback')
+        self.fallback_services = [s.strip() for s in (get_setting('fallback_services') or '').split(',') if s.strip()]
+        self.lingva_url = get_setting('lingva_url') or 'https://lingva.ml'
+        self.libretranslate_url = get_setting('libretranslate_url') or 'https://translate.argosopentech.com'
         
         # Validate API key for services that require one
         self._validate_api_key_on_load()
@@ -192,22 +441,27 @@ class SubtitleTranslatorPlayer(xbmc.Player):
         'anthropic': 'anthropic_api_key',
     }
     
+    def _api_key_setting(self, service=None):
+        """Setting key of the service's API key, or None if it needs none."""
+        return self._API_KEY_SERVICES.get(service or self.translation_service)
+    
     def _service_needs_api_key(self, service=None):
         """Check if a service requires an API key."""
-        service = service or self.translation_service
-        return service in self._API_KEY_SERVICES
+        return self._api_key_setting(service) is not None
     
     def _get_api_key_for_service(self, service=None):
         """Get the API key for a service, or empty string if none."""
-        service = service or self.translation_service
-        setting_key = self._API_KEY_SERVICES.get(service)
-        if setting_key:
-            return get_setting(setting_key)
-        return ''
+        setting_key = self._api_key_setting(service)
+        return get_setting(setting_key) if setting_key else ''
+    
+    def _api_key_missing(self, service=None):
+        """True if the service requires an API key that isn't set."""
+        setting_key = self._api_key_setting(service)
+        return setting_key is not None and not get_setting(setting_key)
     
     def _validate_api_key_on_load(self):
         """Validate API key at settings load time and notify user if missing."""
-        if self._service_needs_api_key() and not self._get_api_key_for_service():
+        if self._api_key_missing():
             service_name = self.translation_service.replace('_', ' ').title()
             msg = get_string(30851).format(service_name)  # "{0} requires an API key..."
             log(msg, level=xbmc.LOGWARNING)
@@ -220,15 +474,19 @@ class SubtitleTranslatorPlayer(xbmc.Player):
         """Check if FFmpeg is available. If not, show a dialog with options.
         
         Returns:
-            FFmpeg path string if found, or None if user cancelled.
+            SubtitleExtractor using a working FFmpeg, or None if user cancelled.
         """
+        if self._extractor is not None:
+            return self._extractor
+        
         from lib.subtitle_extractor import SubtitleExtractor as SE, is_android, download_ffmpeg_android
         
         while True:
             # Try creating extractor with configured path
             test_extractor = SE(configured_path if configured_path else None)
             if test_extractor.ffmpeg_path:
-                return test_extractor.ffmpeg_path
+                self._extractor = test_extractor
+                return test_extractor
             
             # FFmpeg not found — show dialog with options
             dialog = xbmcgui.Dialog()
@@ -278,7 +536,8 @@ class SubtitleTranslatorPlayer(xbmc.Player):
                         except:
                             pass
                         notify(get_string(30875))  # "FFmpeg downloaded successfully!"
-                        return ffmpeg_path
+                        self._extractor = test
+                        return test
                 
                 # Download failed
                 dialog.ok(get_string(30860), get_string(30876))  # "Download failed..."
@@ -307,7 +566,8 @@ class SubtitleTranslatorPlayer(xbmc.Player):
                         except:
                             pass
                         notify(get_string(30867).format(ffmpeg_file))
-                        return ffmpeg_file
+                        self._extractor = test
+                        return test
                     else:
                         dialog.ok(get_string(30860), 
                                   get_string(30869).format(ffmpeg_file))
@@ -326,7 +586,7 @@ class SubtitleTranslatorPlayer(xbmc.Player):
         Returns:
             The actual service name to use (may differ from self.translation_service).
         """
-        if self._service_needs_api_key() and not self._get_api_key_for_service():
+        if self._api_key_missing():
             original = self.translation_service.replace('_', ' ').title()
             msg = get_string(30850).format(original)  # "No API key for {0} — using Lingva"
             log(msg, level=xbmc.LOGWARNING)
@@ -336,39 +596,60 @@ class SubtitleTranslatorPlayer(xbmc.Player):
     
     def onAVStarted(self):
         """Called when audio/video playback starts."""
-        if not self.enabled:
+        # Cheap setting checks before any JSON-RPC round trip
+        if not self.enabled or self.translation_in_progress:
+            return
+        if not self.target_language or not self.translation_service:
+            log("No target language or translation service configured, skipping")
             return
         
         try:
             self.current_file = self.getPlayingFile()
             log(f"Playback started: {self.current_file}")
             
-            # Wait a moment for Kodi to load subtitle info
-            xbmc.sleep(2000)
+            # List external subtitle files in the background while polling
+            self._external_listing = None
+            listing = threading.Thread(target=self._list_external_subtitles, daemon=True)
+            listing.start()
+            
+            # Poll until Kodi has loaded subtitle info (up to 2 s)
+            available_subs = []
+            for _ in range(20):
+                available_subs = self.get_available_subtitles()
+                if available_subs or self._monitor.waitForAbort(0.1):
+                    break
+            
+            listing.join()
+            if self._monitor.abortRequested():
+                return
             
             if self.isPlaying():
-                self.check_and_translate_subtitles()
+                self.check_and_translate_subtitles(available_subs)
         except Exception as e:
             log(f"Error in onAVStarted: {e}", level=xbmc.LOGERROR)
     
-    def check_and_translate_subtitles(self):
+    def check_and_translate_subtitles(self, available_subs=None):
         """Check if translation is needed and perform it."""
         if self.translation_in_progress:
             log("Translation already in progress, skipping")
             return
         
+        # Library entry points are bound on the first playback that gets here
+        init_libraries()
+        
         try:
-            # Get available embedded subtitles
-            available_subs = self.get_available_subtitles()
+            # Get available embedded subtitles, unless the caller already
+            # polled for them (an empty list then means there are none)
+            if available_subs is None:
+                available_subs = self.get_available_subtitles()
             log(f"Available embedded subtitles: {available_subs}")
             log(f"Target language: {self.target_language}, Source language: {self.source_language}")
             log(f"ask_before_translate: {self.ask_before_translate}")
             
             # Check if target language is already available in embedded subtitles
-            target_in_embedded = any(
-                self._lang_match(sub.get('language', ''), self.target_language)
-                for sub in available_subs
-            )
+            target_in_embedded = self._target_norm in {
+                normalize_lang(sub.get('language', '')) for sub in available_subs
+            }
             
             # Also check if target language exists as external subtitle
             target_external_path = self.find_external_subtitle_for_language(self.target_language)
@@ -517,42 +798,43 @@ class SubtitleTranslatorPlayer(xbmc.Player):
         except Exception as e:
             log(f"Error checking subtitles: {e}", level=xbmc.LOGERROR)
     
+    def _set_paused(self, paused, message_id=None):
+        """
+        Pause or resume the active player with Player.PlayPause. The status
+        notification is only shown once the player reports the new state.
+        
+        Returns:
+            True if the player reported the requested state
+        """
+        players = execute_jsonrpc('Player.GetActivePlayers') or []
+        if not players:
+            return False
+        # Prefer the video player if several are active
+        player = next((p for p in players if p.get('type') == 'video'), players[0])
+        
+        state = execute_jsonrpc('Player.PlayPause', {'playerid': player.get('playerid'),
+                                                     'play': not paused})
+        if not state or (state.get('speed') == 0) != paused:
+            return False
+        
+        if message_id is not None and self.show_notification:
+            notify(get_string(message_id))
+        return True
+    
     def get_available_subtitles(self):
         """Get list of available subtitles for current video."""
         subtitles = []
         
-        # Get subtitle streams from video info
-        info = self.getVideoInfoTag()
-        
-        # Use JSON-RPC to get detailed player info
-        result = execute_jsonrpc('Player.GetProperties', {
-            'playerid': 1,
-            'properties': ['subtitles', 'currentsubtitle']
-        })
+        # Use JSON-RPC to get detailed player info (polled, so pre-serialized)
+        result = _json_loads(xbmc.executeJSONRPC(_SUBTITLE_PROPS_REQUEST)).get('result')
         
         if result and 'subtitles' in result:
             subtitles = result['subtitles']
         
         return subtitles
     
-    @staticmethod
-    def _lang_match(lang_a, lang_b):
-        """Match language codes flexibly: sv == sv_se == sv_SE, en == eng, etc."""
-        a = lang_a.lower().replace('-', '_').split('_')[0][:3]
-        b = lang_b.lower().replace('-', '_').split('_')[0][:3]
-        # Handle 2-char vs 3-char ISO codes
-        MAP = {'eng': 'en', 'swe': 'sv', 'nor': 'no', 'dan': 'da', 'fin': 'fi',
-               'deu': 'de', 'ger': 'de', 'fra': 'fr', 'fre': 'fr', 'spa': 'es',
-               'ita': 'it', 'por': 'pt', 'pol': 'pl', 'nld': 'nl', 'dut': 'nl',
-               'rus': 'ru', 'ukr': 'uk', 'jpn': 'ja', 'zho': 'zh', 'chi': 'zh'}
-        a = MAP.get(a, a)
-        b = MAP.get(b, b)
-        return a == b
-
     def find_source_subtitle(self, subtitles):
         """Find the best source subtitle for translation."""
-        source_lang = self.source_language.lower()
-        
         # Filter out bitmap subtitle formats (PGS, VobSub, DVB) — can't translate those
         BITMAP_CODECS = {'hdmv_pgs_subtitle', 'dvd_subtitle', 'dvb_subtitle', 'xsub'}
         text_subs = [s for s in subtitles if s.get('codec', '').lower() not in BITMAP_CODECS]
@@ -569,22 +851,19 @@ class SubtitleTranslatorPlayer(xbmc.Player):
             log(f"Skipping {len(bitmap_subs)} bitmap subtitle track(s), "
                 f"using {len(text_subs)} text-based track(s)")
         
-        # First, try to find the specified source language
-        if source_lang != 'auto':
-            for sub in text_subs:
-                if self._lang_match(sub.get('language', ''), source_lang):
-                    return sub
-        
-        # Fallback: look for English
+        # One pass: the specified source language wins outright, else the
+        # first English track, else the first text subtitle
+        english = None
         for sub in text_subs:
-            if self._lang_match(sub.get('language', ''), 'en'):
+            lang = normalize_lang(sub.get('language', ''))
+            if lang == self._source_norm:
                 return sub
+            if english is None and lang == 'en':
+                english = sub
         
-        # Last resort: take the first text subtitle
-        if text_subs:
-            return text_subs[0]
-        
-        return None
+        if english is not None:
+            return english
+        return text_subs[0] if text_subs else None
     
     def translate_subtitle(self, source_sub):
         """Translate the subtitle with progress tracking."""
@@ -600,7 +879,7 @@ class SubtitleTranslatorPlayer(xbmc.Player):
             cache_key = self.get_cache_key(source_sub)
             cached_path = self.get_cached_subtitle(cache_key)
             
-            if cached_path and xbmcvfs.exists(cached_path):
+            if cached_path:
                 get_debug_logger().info(f"Cache hit: {cached_path}", 'cache')
                 
                 # Also save alongside video if enabled
@@ -614,19 +893,24 @@ class SubtitleTranslatorPlayer(xbmc.Player):
             
             get_debug_logger().debug("Cache miss, starting translation", 'cache')
             
+            # Don't rerun a long FFmpeg extraction that recently failed
+            if get_negative_cache().contains(self.current_file, source_sub.get('index', 0)):
+                log(f"Skipping subtitle stream {source_sub.get('index', 0)}: extraction failed recently",
+                    xbmc.LOGWARNING)
+                if self.show_notification:
+                    notify(get_string(30877), icon=xbmcgui.NOTIFICATION_WARNING)
+                return
+            
             # Check if FFmpeg is available BEFORE pausing playback or showing progress
-            ffmpeg_path = self._ensure_ffmpeg_available(get_setting('ffmpeg_path'))
-            if ffmpeg_path is None:
+            extractor = self._ensure_ffmpeg_available(self.ffmpeg_path)
+            if extractor is None:
                 log("User cancelled FFmpeg setup")
                 return
             
             # Pause playback during translation
-            if self.isPlaying():
+            if self._set_paused(True, 30717):  # "Pausing playback during translation..."
                 was_playing = True
-                self.pause()
                 log("Paused playback during translation")
-                if self.show_notification:
-                    notify(get_string(30717))  # "Pausing playback during translation..."
             
             # Initialize progress dialog
             progress = TranslationProgress(show_dialog=self.show_notification)
@@ -651,13 +935,17 @@ class SubtitleTranslatorPlayer(xbmc.Player):
                            "Bitmap subtitles cannot be translated")
                 raise Exception(error_msg)
             
-            extractor = SubtitleExtractor(ffmpeg_path)
-            subtitle_content = extractor.extract(
-                self.current_file,
-                source_sub.get('index', 0)
-            )
+            try:
+                subtitle_content = extractor.extract(
+                    self.current_file,
+                    source_sub.get('index', 0)
+                )
+            except Exception:
+                get_negative_cache().add(self.current_file, source_sub.get('index', 0))
+                raise
             
             if not subtitle_content:
+                get_negative_cache().add(self.current_file, source_sub.get('index', 0))
                 error_msg = "Failed to extract subtitle - FFmpeg returned empty content"
                 get_error_reporter().report_error('ffmpeg', error_msg, context={
                     'file': self.current_file,
@@ -666,265 +954,15 @@ class SubtitleTranslatorPlayer(xbmc.Player):
                 raise Exception(error_msg)
             
             get_debug_logger().debug(f"Extracted {len(subtitle_content)} bytes", 'ffmpeg')
+            get_negative_cache().discard(self.current_file, source_sub.get('index', 0))
             
-            # Parse subtitle
-            progress.set_stage('parse', get_string(30708))  # "Parsing subtitle file..."
-            parser = SubtitleParser()
-            entries = parser.parse(subtitle_content)
-            
-            if not entries:
-                error_msg = "No subtitle entries found in extracted content"
-                get_error_reporter().report_error('parse', error_msg, context={
-                    'content_length': len(subtitle_content),
-                    'content_preview': subtitle_content[:500]
-                })
-                raise Exception(error_msg)
-            
-            get_debug_logger().info(f"Parsed {len(entries)} subtitle entries", 'parse')
-            progress.total = len(entries)
-            
-            # Check for cancellation
-            if progress.is_cancelled():
-                get_debug_logger().info("Translation cancelled by user", 'translation')
+            # Same subtitle track already translated for another file?
+            content_key = self.get_content_cache_key(subtitle_content)
+            if self._load_from_content_cache(content_key, cache_key, progress):
                 return
             
-            # Auto-fallback if API key missing
-            actual_service = self._auto_fallback_if_needed()
-            translation_start_time = time.time()
-            
-            # Get translator
-            # Show which service is being used
-            service_display = actual_service.replace('_', ' ').title()
-            progress.set_stage('translate', f"{get_string(30709)}\n🔗 {service_display}")  # "Connecting to translation service..."
-            progress.set_service(service_display)
-            get_debug_logger().debug(f"Using translation service: {actual_service}", 'api')
-            
-            translator = get_translator(
-                actual_service,
-                self.get_service_config() if actual_service == self.translation_service else self._get_fallback_config(actual_service)
-            )
-            
-            # Set media context for context-aware translation (film title, plot, genre etc.)
-            try:
-                from lib.dialogs import get_media_context
-                media_ctx = get_media_context()
-                if media_ctx:
-                    translator.set_media_context(media_ctx)
-                    ctx_display = media_ctx.get('display', '')
-                    if ctx_display:
-                        get_debug_logger().debug(f"Media context: {ctx_display}", 'api')
-            except Exception:
-                pass
-            
-            # Translate in batches with progress
-            translated_entries = []
-            batch_size = self.batch_size
-            total_batches = (len(entries) + batch_size - 1) // batch_size
-            
-            # Track success/failure
-            successful_batches = 0
-            failed_batches = 0
-            max_consecutive_failures = 3  # Abort after 3 consecutive failures
-            consecutive_failures = 0
-            
-            # Get fallback services
-            fallback_services = []
-            if get_setting_bool('enable_fallback'):
-                fallback_str = get_setting('fallback_services')
-                if fallback_str:
-                    fallback_services = [s.strip() for s in fallback_str.split(',') if s.strip()]
-            
-            get_debug_logger().debug(f"Translating in {total_batches} batches of {batch_size}", 'translation')
-            
-            for batch_num, i in enumerate(range(0, len(entries), batch_size)):
-                if progress.is_cancelled():
-                    get_debug_logger().info("Translation cancelled by user", 'translation')
-                    return
-                
-                batch = entries[i:i + batch_size]
-                texts = [e['text'] for e in batch]
-                
-                # Update progress with percentage
-                current_count = i + len(batch)
-                percent = int((current_count / len(entries)) * 100)
-                progress.update(
-                    current_count,
-                    f"{get_string(30710).format(batch_num + 1, total_batches)} ({percent}%)"
-                )
-                
-                translated_texts = None
-                last_error = None
-                
-                # Try primary translator
-                try:
-                    get_debug_logger().debug(f"Translating batch {batch_num + 1}: {len(texts)} entries", 'api')
-                    import time as _time
-                    start_time = _time.time()
-                    
-                    translated_texts = translator.translate_batch(
-                        texts,
-                        self.source_language,
-                        self.target_language
-                    )
-                    
-                    elapsed = (_time.time() - start_time) * 1000
-                    get_debug_logger().timing(f"Batch {batch_num + 1} translation", elapsed)
-                    successful_batches += 1
-                    consecutive_failures = 0
-                    
-                except Exception as api_error:
-                    last_error = api_error
-                    # Rate-limit log spam: only log first 3 primary failures, then every 50th
-                    if not hasattr(self, '_primary_fail_count'):
-                        self._primary_fail_count = 0
-                    self._primary_fail_count += 1
-                    if self._primary_fail_count <= 3:
-                        get_debug_logger().error(f"Primary translator failed: {api_error}", 'api')
-                        if self._primary_fail_count == 3:
-                            get_debug_logger().error("Suppressing further primary translator errors (will log every 50th)", 'api')
-                    elif self._primary_fail_count % 50 == 0:
-                        get_debug_logger().error(f"Primary translator still failing ({self._primary_fail_count} times): {api_error}", 'api')
-                    
-                    # Try fallback services
-                    for fallback_service in fallback_services:
-                        if fallback_service == self.translation_service:
-                            continue
-                        try:
-                            get_debug_logger().info(f"Trying fallback: {fallback_service}", 'api')
-                            progress.update(current_count, f"Fallback: {fallback_service}...")
-                            
-                            fallback_config = {'timeout': get_setting_int('request_timeout')}
-                            if fallback_service == 'lingva':
-                                fallback_config['url'] = get_setting('lingva_url') or 'https://lingva.ml'
-                            elif fallback_service == 'libretranslate':
-                                fallback_config['url'] = get_setting('libretranslate_url') or 'https://translate.argosopentech.com'
-                            
-                            fallback_translator = get_translator(fallback_service, fallback_config)
-                            translated_texts = fallback_translator.translate_batch(
-                                texts,
-                                self.source_language,
-                                self.target_language
-                            )
-                            successful_batches += 1
-                            consecutive_failures = 0
-                            get_debug_logger().info(f"Fallback {fallback_service} succeeded", 'api')
-                            break
-                        except Exception as fallback_error:
-                            # Rate-limit fallback error logging
-                            if not hasattr(self, '_fallback_fail_counts'):
-                                self._fallback_fail_counts = {}
-                            key = fallback_service
-                            self._fallback_fail_counts[key] = self._fallback_fail_counts.get(key, 0) + 1
-                            fc = self._fallback_fail_counts[key]
-                            if fc <= 3 or fc % 50 == 0:
-                                get_debug_logger().error(f"Fallback {fallback_service} failed ({fc}x): {fallback_error}", 'api')
-                            
-                            # Exponential backoff on rate limit (429)
-                            err_str = str(fallback_error)
-                            if '429' in err_str or 'Too Many Requests' in err_str:
-                                import time as _time
-                                backoff = min(2 ** min(fc - 1, 5), 32)
-                                if fc <= 3:
-                                    get_debug_logger().info(f"Rate limited by {fallback_service}, backing off {backoff}s", 'api')
-                                _time.sleep(backoff)
-                            continue
-                
-                # If all translators failed for this batch
-                if translated_texts is None:
-                    failed_batches += 1
-                    consecutive_failures += 1
-                    
-                    get_error_reporter().report_error('api', f"All translators failed for batch {batch_num + 1}", last_error, {
-                        'service': self.translation_service,
-                        'fallbacks_tried': fallback_services,
-                        'batch_size': len(texts)
-                    })
-                    
-                    # Check if we should abort
-                    if consecutive_failures >= max_consecutive_failures:
-                        raise Exception(f"Translation aborted: {consecutive_failures} consecutive failures. Check your translation service settings.")
-                    
-                    # Use original text only if we've had some successes (partial translation)
-                    if successful_batches > 0:
-                        progress.add_warning(f"Batch {batch_num + 1} failed, using original text")
-                        translated_texts = texts
-                    else:
-                        # No successful batches yet - abort early
-                        raise Exception(f"Translation service unavailable: {last_error}")
-                
-                for j, entry in enumerate(batch):
-                    translated_entry = entry.copy()
-                    if j < len(translated_texts):
-                        translated_entry['text'] = translated_texts[j]
-                    translated_entries.append(translated_entry)
-                
-                # Small delay between batches to avoid rate limiting
-                if i + batch_size < len(entries):
-                    xbmc.sleep(500)
-            
-            # Check if translation was mostly successful
-            success_rate = successful_batches / total_batches if total_batches > 0 else 0
-            if success_rate < 0.5:
-                raise Exception(f"Translation failed: only {successful_batches}/{total_batches} batches translated successfully")
-            
-            # Verify that text actually changed (detect false "success" where original text was kept)
-            unchanged_count = 0
-            for orig, trans in zip(entries, translated_entries):
-                if orig.get('text', '').strip() == trans.get('text', '').strip():
-                    unchanged_count += 1
-            unchanged_ratio = unchanged_count / len(entries) if entries else 0
-            log(f"Translation check: {unchanged_count}/{len(entries)} unchanged ({unchanged_ratio:.0%})")
-            # Log first 3 entries for debugging
-            for idx in range(min(3, len(entries))):
-                orig_text = entries[idx].get('text', '')[:60]
-                trans_text = translated_entries[idx].get('text', '')[:60] if idx < len(translated_entries) else '?'
-                log(f"  Sample {idx+1}: '{orig_text}' → '{trans_text}'")
-            if unchanged_ratio > 0.95:
-                raise Exception(
-                    f"Translation failed: {unchanged_count}/{len(entries)} entries "
-                    f"({unchanged_ratio:.0%}) were not translated. "
-                    f"The translation service may be unreachable. "
-                    f"Try a different service in settings."
-                )
-            
-            # Format output (90%)
-            progress.set_stage('format', f"{get_string(30708)} (90%)")  # Parsing/formatting
-            get_debug_logger().debug(f"Generating {self.subtitle_format} output", 'format')
-            
-            # Determine service label early for disclaimer
-            service_label = actual_service.replace('_', ' ').title()
-            
-            # Add disclaimer as first subtitle entries
-            disclaimer_entries = self._make_disclaimer(service_label)
-            # Shift existing indices
-            num_disclaimer = len(disclaimer_entries)
-            for entry in translated_entries:
-                entry['index'] = entry.get('index', 0) + num_disclaimer
-            for i, d in enumerate(disclaimer_entries):
-                d['index'] = i + 1
-            translated_entries = disclaimer_entries + translated_entries
-            
-            output_content = parser.generate(
-                translated_entries,
-                self.subtitle_format
-            )
-            
-            # Save subtitle (95%)
-            progress.set_stage('save', f"{get_string(30711)} (95%)")  # "Saving translated subtitles..."
-            output_path = self.save_subtitle(output_content, cache_key)
-            get_debug_logger().info(f"Saved subtitle to: {output_path}", 'save')
-            
-            # Load the translated subtitle
-            self.load_subtitle(output_path)
-            
-            # Complete with service name and elapsed time
-            elapsed_secs = time.time() - translation_start_time
-            elapsed_str = self._format_elapsed(elapsed_secs)
-            
-            summary = progress.get_summary()
-            get_debug_logger().info(f"Translation complete: {summary}", 'translation')
-            completion_msg = get_string(30852).format(len(translated_entries), service_label, elapsed_str)
-            progress.complete(True, completion_msg)
+            self._translate_content(subtitle_content, cache_key, content_key, progress,
+                                    "extracted content")
             
         except Exception as e:
             get_debug_logger().error(f"Translation failed: {e}", 'translation')
@@ -947,13 +985,9 @@ class SubtitleTranslatorPlayer(xbmc.Player):
             # Resume playback if we paused it
             if was_playing:
                 try:
-                    # Check if player is paused using condition visibility
-                    is_paused = xbmc.getCondVisibility('Player.Paused')
-                    if is_paused:
-                        self.pause()  # Toggle pause to resume
+                    # play=True is a no-op if the user already resumed
+                    if self._set_paused(False, 30718):  # "Resuming playback"
                         log("Resumed playback after translation")
-                        if self.show_notification:
-                            notify(get_string(30718))  # "Resuming playback"
                 except Exception as e:
                     log(f"Could not resume playback: {e}", level=xbmc.LOGWARNING)
     
@@ -970,7 +1004,7 @@ class SubtitleTranslatorPlayer(xbmc.Player):
             cache_key = self.get_cache_key_external(subtitle_path)
             cached_path = self.get_cached_subtitle(cache_key)
             
-            if cached_path and xbmcvfs.exists(cached_path):
+            if cached_path:
                 get_debug_logger().info(f"Cache hit: {cached_path}", 'cache')
                 
                 if self.save_alongside:
@@ -984,12 +1018,9 @@ class SubtitleTranslatorPlayer(xbmc.Player):
             get_debug_logger().debug("Cache miss, starting translation", 'cache')
             
             # Pause playback during translation
-            if self.isPlaying():
+            if self._set_paused(True, 30717):
                 was_playing = True
-                self.pause()
                 log("Paused playback during translation")
-                if self.show_notification:
-                    notify(get_string(30717))
             
             # Initialize progress dialog
             progress = TranslationProgress(show_dialog=self.show_notification)
@@ -1008,136 +1039,146 @@ class SubtitleTranslatorPlayer(xbmc.Player):
             
             get_debug_logger().debug(f"Read {len(subtitle_content)} bytes", 'file')
             
-            # Parse subtitle
-            progress.set_stage('parse', get_string(30708))
-            parser = SubtitleParser()
-            entries = parser.parse(subtitle_content)
-            
-            if not entries:
-                error_msg = "No subtitle entries found in external file"
-                get_error_reporter().report_error('parse', error_msg, context={
-                    'content_length': len(subtitle_content),
-                    'content_preview': subtitle_content[:500]
-                })
-                raise Exception(error_msg)
-            
-            get_debug_logger().info(f"Parsed {len(entries)} subtitle entries", 'parse')
-            progress.total = len(entries)
-            
-            if progress.is_cancelled():
-                get_debug_logger().info("Translation cancelled by user", 'translation')
+            # Same subtitle already translated from another path?
+            content_key = self.get_content_cache_key(subtitle_content)
+            if self._load_from_content_cache(content_key, cache_key, progress):
                 return
             
-            # Auto-fallback if API key missing
-            actual_service = self._auto_fallback_if_needed()
-            translation_start_time = time.time()
-            
-            # Get translator
-            progress.set_stage('translate', get_string(30709))
-            get_debug_logger().debug(f"Using translation service: {actual_service}", 'api')
-            
-            translator = get_translator(
-                actual_service,
-                self.get_service_config() if actual_service == self.translation_service else self._get_fallback_config(actual_service)
-            )
-            
-            # Translate in batches with progress
-            translated_entries = []
-            batch_size = self.batch_size
-            total_batches = (len(entries) + batch_size - 1) // batch_size
-            
-            successful_batches = 0
-            failed_batches = 0
-            max_consecutive_failures = 3
-            consecutive_failures = 0
+            self._translate_content(subtitle_content, cache_key, content_key, progress,
+                                    "external file")
             
-            fallback_services = []
-            if get_setting_bool('enable_fallback'):
-                fallback_str = get_setting('fallback_services')
-                if fallback_str:
-                    fallback_services = [s.strip() for s in fallback_str.split(',') if s.strip()]
+        except Exception as e:
+            get_debug_logger().error(f"Translation failed: {e}", 'translation')
+            get_error_reporter().report_error('translation', f"Translation failed: {str(e)}", e, {
+                'file': subtitle_path,
+                'service': self.translation_service,
+                'source_lang': self.source_language,
+                'target_lang': self.target_language
+            })
             
-            get_debug_logger().debug(f"Translating in {total_batches} batches of {batch_size}", 'translation')
+            if progress:
+                progress.add_error(str(e))
+                progress.complete(False)
+            else:
+                notify(get_string(30702), icon=xbmcgui.NOTIFICATION_ERROR)
+        
+        finally:
+            self.translation_in_progress = False
             
-            for batch_num, i in enumerate(range(0, len(entries), batch_size)):
-                if progress.is_cancelled():
+            if was_playing:
+                try:
+                    if self._set_paused(False, 30718):
+                        log("Resumed playback after translation")
+                except Exception as e:
+                    log(f"Could not resume playback: {e}", level=xbmc.LOGWARNING)
+    
+    def _translate_content(self, subtitle_content, cache_key, content_key, progress, source_desc):
+        """
+        Parse, translate, save and load a subtitle. Shared by embedded and
+        external subtitles once their content has been read.
+        
+        Raises:
+            Exception: when parsing or translation fails
+        """
+        # Parse subtitle
+        progress.set_stage('parse', get_string(30708))  # "Parsing subtitle file..."
+        parser = SubtitleParser()
+        # One streaming pass collects the entries and their distinct lines
+        entries = []
+        unique_lines = {}
+        for entry in parser.parse_iter(subtitle_content):
+            entries.append(entry)
+            unique_lines[entry['text'].strip()] = None
+        
+        if not entries:
+            error_msg = f"No subtitle entries found in {source_desc}"
+            get_error_reporter().report_error('parse', error_msg, context={
+                'content_length': len(subtitle_content),
+                'content_preview': subtitle_content[:500]
+            })
+            raise Exception(error_msg)
+        
+        get_debug_logger().info(f"Parsed {len(entries)} subtitle entries", 'parse')
+        progress.total = len(entries)
+        
+        # Check for cancellation
+        if progress.is_cancelled():
+            get_debug_logger().info("Translation cancelled by user", 'translation')
+            return
+        
+        # Auto-fallback if API key missing
+        actual_service = self._auto_fallback_if_needed()
+        translation_start_time = time.perf_counter()
+        
+        # Get translator
+        # Show which service is being used
+        service_display = actual_service.replace('_', ' ').title()
+        progress.set_stage('translate', f"{get_string(30709)}\n🔗 {service_display}")  # "Connecting to translation service..."
+        progress.set_service(service_display)
+        get_debug_logger().debug(f"Using translation service: {actual_service}", 'api')
+        
+        translator = get_translator(
+            actual_service,
+            self.get_service_config() if actual_service == self.translation_service else self._get_fallback_config(actual_service)
+        )
+        
+        # Set media context for context-aware translation (film title, plot, genre etc.)
+        try:
+            from lib.dialogs import get_media_context
+            media_ctx = get_media_context()
+            if media_ctx:
+                translator.set_media_context(media_ctx)
+                ctx_display = media_ctx.get('display', '')
+                if ctx_display:
+                    get_debug_logger().debug(f"Media context: {ctx_display}", 'api')
+        except Exception:
+            pass
+        
+        # Translate in batches with progress. Each distinct line is sent
+        # once; repeats ("Yeah.", names...) are filled in from trans_map
+        unique_texts = list(unique_lines)
+        trans_map = {}
+        batch_size = self.batch_size
+        total_batches = (len(unique_texts) + batch_size - 1) // batch_size
+        
+        # Track success/failure
+        successful_batches = 0
+        failed_batches = 0
+        max_consecutive_failures = 3  # Abort after 3 consecutive failures
+        consecutive_failures = 0
+        
+        # Get fallback services
+        fallback_services = self.fallback_services if self.enable_fallback else []
+        
+        get_debug_logger().debug(f"Translating {len(unique_texts)} unique lines in {total_batches} batches of {batch_size}", 'translation')
+        
+        batches = self._iter_translated_batches(translator, unique_texts, batch_size,
+                                                fallback_services, progress)
+        last_update = 0.0
+        batch_msg = get_string(30710)  # "Translating batch {0}/{1}..."
+        try:
+            for batch_num, i, texts, translated_texts, last_error in batches:
+                if progress.is_cancelled() or self._monitor.abortRequested():
                     get_debug_logger().info("Translation cancelled by user", 'translation')
                     return
                 
-                batch = entries[i:i + batch_size]
-                texts = [e['text'] for e in batch]
-                
-                current_count = i + len(batch)
-                percent = int((current_count / len(entries)) * 100)
-                progress.update(
-                    current_count,
-                    f"{get_string(30710).format(batch_num + 1, total_batches)} ({percent}%)"
-                )
-                
-                translated_texts = None
-                last_error = None
-                
-                try:
-                    get_debug_logger().debug(f"Translating batch {batch_num + 1}: {len(texts)} entries", 'api')
-                    import time as _time
-                    start_time = _time.time()
-                    
-                    translated_texts = translator.translate_batch(
-                        texts,
-                        self.source_language,
-                        self.target_language
+                # Update progress with percentage, at most every
+                # PROGRESS_UPDATE_INTERVAL (small batches finish quickly)
+                now = time.perf_counter()
+                if now - last_update >= PROGRESS_UPDATE_INTERVAL or batch_num == total_batches - 1:
+                    last_update = now
+                    current_count = len(entries) * (i + len(texts)) // len(unique_texts)
+                    percent = int((current_count / len(entries)) * 100)
+                    progress.update(
+                        current_count,
+                        f"{batch_msg.format(batch_num + 1, total_batches)} ({percent}%)"
                     )
-                    
-                    elapsed = (_time.time() - start_time) * 1000
-                    get_debug_logger().timing(f"Batch {batch_num + 1} translation", elapsed)
+                
+                if translated_texts is not None:
                     successful_batches += 1
                     consecutive_failures = 0
-                    
-                except Exception as api_error:
-                    last_error = api_error
-                    get_debug_logger().error(f"Primary translator failed: {api_error}", 'api')
-                    
-                    for fallback_service in fallback_services:
-                        if fallback_service == self.translation_service:
-                            continue
-                        try:
-                            get_debug_logger().info(f"Trying fallback: {fallback_service}", 'api')
-                            progress.update(current_count, f"Fallback: {fallback_service}...")
-                            
-                            fallback_config = {'timeout': get_setting_int('request_timeout')}
-                            if fallback_service == 'lingva':
-                                fallback_config['url'] = get_setting('lingva_url') or 'https://lingva.ml'
-                            elif fallback_service == 'libretranslate':
-                                fallback_config['url'] = get_setting('libretranslate_url') or 'https://translate.argosopentech.com'
-                            
-                            fallback_translator = get_translator(fallback_service, fallback_config)
-                            translated_texts = fallback_translator.translate_batch(
-                                texts,
-                                self.source_language,
-                                self.target_language
-                            )
-                            successful_batches += 1
-                            consecutive_failures = 0
-                            get_debug_logger().info(f"Fallback {fallback_service} succeeded", 'api')
-                            break
-                        except Exception as fallback_error:
-                            if not hasattr(self, '_fallback_fail_counts2'):
-                                self._fallback_fail_counts2 = {}
-                            key = fallback_service
-                            self._fallback_fail_counts2[key] = self._fallback_fail_counts2.get(key, 0) + 1
-                            fc = self._fallback_fail_counts2[key]
-                            if fc <= 3 or fc % 50 == 0:
-                                get_debug_logger().error(f"Fallback {fallback_service} failed ({fc}x): {fallback_error}", 'api')
-                            err_str = str(fallback_error)
-                            if '429' in err_str or 'Too Many Requests' in err_str:
-                                import time as _time
-                                backoff = min(2 ** min(fc - 1, 5), 32)
-                                if fc <= 3:
-                                    get_debug_logger().info(f"Rate limited by {fallback_service}, backing off {backoff}s", 'api')
-                                _time.sleep(backoff)
-                            continue
-                
-                if translated_texts is None:
+                else:
+                    # All translators failed for this batch
                     failed_batches += 1
                     consecutive_failures += 1
                     
@@ -1147,94 +1188,79 @@ class SubtitleTranslatorPlayer(xbmc.Player):
                         'batch_size': len(texts)
                     })
                     
+                    # Check if we should abort
                     if consecutive_failures >= max_consecutive_failures:
-                        raise Exception(f"Translation aborted: {consecutive_failures} consecutive failures.")
+                        raise Exception(f"Translation aborted: {consecutive_failures} consecutive failures. Check your translation service settings.")
                     
+                    # Use original text only if we've had some successes (partial translation)
                     if successful_batches > 0:
                         progress.add_warning(f"Batch {batch_num + 1} failed, using original text")
                         translated_texts = texts
                     else:
+                        # No successful batches yet - abort early
                         raise Exception(f"Translation service unavailable: {last_error}")
                 
-                for j, entry in enumerate(batch):
-                    translated_entry = entry.copy()
-                    if j < len(translated_texts):
-                        translated_entry['text'] = translated_texts[j]
-                    translated_entries.append(translated_entry)
-                
-                if i + batch_size < len(entries):
-                    xbmc.sleep(500)
-            
-            success_rate = successful_batches / total_batches if total_batches > 0 else 0
-            if success_rate < 0.5:
-                raise Exception(f"Translation failed: only {successful_batches}/{total_batches} batches translated successfully")
-            
-            # Format output
-            progress.set_stage('format', f"{get_string(30708)} (90%)")
-            get_debug_logger().debug(f"Generating {self.subtitle_format} output", 'format')
-            
-            # Determine service label early for disclaimer
-            service_label = actual_service.replace('_', ' ').title()
-            
-            # Add disclaimer as first subtitle entries
-            disclaimer_entries = self._make_disclaimer(service_label)
-            num_disclaimer = len(disclaimer_entries)
-            for entry in translated_entries:
-                entry['index'] = entry.get('index', 0) + num_disclaimer
-            for i, d in enumerate(disclaimer_entries):
-                d['index'] = i + 1
-            translated_entries = disclaimer_entries + translated_entries
-            
-            output_content = parser.generate(
-                translated_entries,
-                self.subtitle_format
+                trans_map.update(zip(texts, translated_texts))
+        finally:
+            batches.close()
+        
+        # Check if translation was mostly successful
+        success_rate = successful_batches / total_batches if total_batches > 0 else 0
+        if success_rate < 0.5:
+            raise Exception(f"Translation failed: only {successful_batches}/{total_batches} batches translated successfully")
+        
+        # Verify that text actually changed (detect false "success" where original text was kept).
+        # Compared once per distinct line; entries are only walked if some came back unchanged
+        unchanged_lines = {text for text, value in trans_map.items() if value.strip() == text}
+        unchanged_count = sum(
+            1 for e in entries if e['text'].strip() in unchanged_lines
+        ) if unchanged_lines else 0
+        unchanged_ratio = unchanged_count / len(entries) if entries else 0
+        log(f"Translation check: {unchanged_count}/{len(entries)} unchanged ({unchanged_ratio:.0%})")
+        # Log first 3 entries for debugging
+        for idx in range(min(3, len(entries))):
+            orig_text = entries[idx].get('text', '')[:60]
+            trans_text = trans_map.get(entries[idx]['text'].strip(), '?')[:60]
+            log(f"  Sample {idx+1}: '{orig_text}' → '{trans_text}'")
+        if unchanged_ratio > 0.95:
+            raise Exception(
+                f"Translation failed: {unchanged_count}/{len(entries)} entries "
+                f"({unchanged_ratio:.0%}) were not translated. "
+                f"The translation service may be unreachable. "
+                f"Try a different service in settings."
             )
-            
-            # Save subtitle
-            progress.set_stage('save', f"{get_string(30711)} (95%)")
-            output_path = self.save_subtitle(output_content, cache_key)
-            get_debug_logger().info(f"Saved subtitle to: {output_path}", 'save')
-            
-            # Load the translated subtitle
-            self.load_subtitle(output_path)
-            
-            # Complete with service name and elapsed time
-            elapsed_secs = time.time() - translation_start_time
-            elapsed_str = self._format_elapsed(elapsed_secs)
-            
-            summary = progress.get_summary()
-            get_debug_logger().info(f"Translation complete: {summary}", 'translation')
-            completion_msg = get_string(30852).format(len(translated_entries), service_label, elapsed_str)
-            progress.complete(True, completion_msg)
-            
-        except Exception as e:
-            get_debug_logger().error(f"Translation failed: {e}", 'translation')
-            get_error_reporter().report_error('translation', f"Translation failed: {str(e)}", e, {
-                'file': subtitle_path,
-                'service': self.translation_service,
-                'source_lang': self.source_language,
-                'target_lang': self.target_language
-            })
-            
-            if progress:
-                progress.add_error(str(e))
-                progress.complete(False)
-            else:
-                notify(get_string(30702), icon=xbmcgui.NOTIFICATION_ERROR)
         
-        finally:
-            self.translation_in_progress = False
-            
-            if was_playing:
-                try:
-                    is_paused = xbmc.getCondVisibility('Player.Paused')
-                    if is_paused:
-                        self.pause()
-                        log("Resumed playback after translation")
-                        if self.show_notification:
-                            notify(get_string(30718))
-                except Exception as e:
-                    log(f"Could not resume playback: {e}", level=xbmc.LOGWARNING)
+        # Format output (90%)
+        progress.set_stage('format', f"{get_string(30708)} (90%)")  # Parsing/formatting
+        get_debug_logger().debug(f"Generating {self.subtitle_format} output", 'format')
+        
+        # Determine service label early for disclaimer
+        service_label = actual_service.replace('_', ' ').title()
+        
+        # Add disclaimer as first subtitle entries; translated entries
+        # are produced on the fly while the output is generated
+        disclaimer_entries = self._make_disclaimer(service_label)
+        output_content = parser.generate(
+            self._iter_output_entries(entries, trans_map, disclaimer_entries),
+            self.subtitle_format
+        )
+        
+        # Save subtitle (95%)
+        progress.set_stage('save', f"{get_string(30711)} (95%)")  # "Saving translated subtitles..."
+        output_path = self.save_subtitle(output_content, cache_key, content_key)
+        get_debug_logger().info(f"Saved subtitle to: {output_path}", 'save')
+        
+        # Load the translated subtitle
+        self.load_subtitle(output_path)
+        
+        # Complete with service name and elapsed time
+        elapsed_secs = time.perf_counter() - translation_start_time
+        elapsed_str = self._format_elapsed(elapsed_secs)
+        
+        summary = progress.get_summary()
+        get_debug_logger().info(f"Translation complete: {summary}", 'translation')
+        completion_msg = get_string(30852).format(len(entries), service_label, elapsed_str)
+        progress.complete(True, completion_msg)
     
     @staticmethod
     def _format_elapsed(seconds):
@@ -1245,51 +1271,504 @@ class SubtitleTranslatorPlayer(xbmc.Player):
             return f"{minutes}m {secs:02d}s"
         return f"{secs}s"
     
+    def _batch_concurrency(self, translator):
+        """Number of batches to keep in flight for this translator. The
+        translator caps its own requests in flight at the same number."""
+        wanted = self.translation_concurrency
+        limit = getattr(translator, 'concurrency', None)
+        return max(1, min(wanted, limit or wanted))
+    
+    def _iter_translated_batches(self, translator, texts, batch_size, fallback_services, progress):
+        """
+        Translate texts in batches, keeping several batches in flight.
+        
+        Requests run on a thread pool so their round trips overlap, but
+        results are yielded strictly in batch order, so callers keep the
+        consecutive-failure handling of a serial loop. A slow batch doesn't
+        idle the pool: later batches keep being started (up to a bounded
+        distance ahead) while it is awaited. Closing the generator cancels
+        batches that haven't started yet. On cancel or abort the pending
+        batch is yielded untranslated and iteration stops.
+        
+        Yields:
+            (batch_num, start index, batch texts, translated texts or None, last error)
+        """
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+        
+        starts = list(range(0, len(texts), batch_size))
+        concurrency = self._batch_concurrency(translator)
+        # How far finished batches may run ahead of the one being yielded
+        max_ahead = concurrency * 2
+        # Set once the primary fails; later batches then race the fallbacks
+        self._hedge_batches = False
+        # (name, translator) of a fallback that took over from the primary
+        self._settled_fallback = None
+        # Fallback translators built for this job, by service
+        self._fallback_translators = {}
+        self._primary_misses = 0
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        futures = {}
+        next_batch = 0
+        
+        def submit_more(head):
+            """Start batches until `concurrency` are running."""
+            nonlocal next_batch
+            running = sum(1 for f in futures.values() if not f.done())
+            while running < concurrency and next_batch < min(head + max_ahead, len(starts)):
+                start = starts[next_batch]
+                batch = texts[start:start + batch_size]
+                futures[next_batch] = pool.submit(
+                    self._translate_batch_with_fallback, translator, batch,
+                    next_batch, fallback_services, progress, start + len(batch)
+                )
+                next_batch += 1
+                running += 1
+        
+        try:
+            for batch_num, i in enumerate(starts):
+                submit_more(batch_num)
+                future = futures[batch_num]
+                # Wait in short slices so a cancel or Kodi shutdown is seen
+                # while a slow request is still in flight; refill the pool
+                # whenever another batch finishes meanwhile
+                while not future.done():
+                    running = [f for f in futures.values() if not f.done()]
+                    wait(running, timeout=0.2, return_when=FIRST_COMPLETED)
+                    if future.done():
+                        break
+                    if progress.is_cancelled() or self._monitor.abortRequested():
+                        # Wake requests waiting out a rate limit so the
+                        # pool shutdown below doesn't wait for them
+                        with _fail_count_lock:
+                            running = [translator, *self._fallback_translators.values()]
+                        for t in running:
+                            t.cancel()
+                        yield batch_num, i, texts[i:i + batch_size], None, None
+                        return
+                    submit_more(batch_num)
+                
+                del futures[batch_num]
+                translated_texts, last_error = future.result()
+                yield batch_num, i, texts[i:i + batch_size], translated_texts, last_error
+        finally:
+            for future in futures.values():
+                future.cancel()
+            pool.shutdown(wait=True)
+    
+    def _translate_batch_with_fallback(self, translator, texts, batch_num, fallback_services,
+                                       progress, current_count):
+        """
+        Translate one batch with the primary translator, trying each
+        fallback service in turn if it fails. Runs on a worker thread.
+        
+        Returns:
+            (translated texts, or None if every service failed; last error)
+        """
+        last_error = None
+        logger = get_debug_logger()
+        
+        # Only when every service is backing off is there nothing to skip
+        # to; then wait for the first deadline, in slices so a cancel or
+        # Kodi shutdown is seen
+        resume_at = min(self._service_not_before.get(s, 0)
+                        for s in [self.translation_service, *fallback_services])
+        while time.monotonic() < resume_at:
+            if progress.is_cancelled() or self._monitor.waitForAbort(
+                    min(resume_at - time.monotonic(), 0.5)):
+                return None, CircuitOpenError("Every service is rate limited")
+        
+        settled = self._settled_fallback
+        if settled is not None:
+            try:
+                return self._call_translator(*settled, texts), None
+            except Exception as e:
+                # Back to racing every service
+                logger.error(f"{settled[0]} failed after taking over: {e}", 'api')
+                with _fail_count_lock:
+                    if self._settled_fallback is settled:
+                        self._settled_fallback = None
+        
+        if self._hedge_batches and fallback_services:
+            return self._race_translators(translator, texts, batch_num, fallback_services,
+                                          progress)
+        
+        # Try primary translator, unless it is still backing off after a 429
+        try:
+            if self._rate_limited(self.translation_service):
+                raise CircuitOpenError(f"{self.translation_service} is rate limited, skipped for now")
+            if logger.enabled:
+                logger.debug(f"Translating batch {batch_num + 1}: {len(texts)} entries", 'api')
+            start_ns = time.perf_counter_ns()
+            
+            translated_texts = self._call_translator(self.translation_service, translator, texts)
+            
+            if logger.enabled:
+                elapsed = (time.perf_counter_ns() - start_ns) / 1e6
+                logger.timing(f"Batch {batch_num + 1} translation", elapsed)
+            return translated_texts, None
+            
+        except CircuitOpenError as open_error:
+            # Known dead, go straight to the fallbacks
+            last_error = open_error
+            with _fail_count_lock:
+                self._hedge_batches = True
+        except Exception as api_error:
+            last_error = api_error
+            with _fail_count_lock:
+                self._hedge_batches = True
+            self._record_failure(self.translation_service, api_error, "Primary")
+        
+        # Try fallback services
+        for fallback_service in fallback_services:
+            if fallback_service == self.translation_service or self._rate_limited(fallback_service):
+                continue
+            try:
+                logger.info(f"Trying fallback: {fallback_service}", 'api')
+                progress.update(current_count, f"Fallback: {fallback_service}...")
+                
+                fallback_translator = self._get_fallback_translator(fallback_service)
+                translated_texts = self._call_translator(fallback_service, fallback_translator, texts)
+                logger.info(f"Fallback {fallback_service} succeeded", 'api')
+                return translated_texts, last_error
+            except CircuitOpenError:
+                continue
+            except Exception as fallback_error:
+                self._record_failure(fallback_service, fallback_error, "Fallback")
+                continue
+        
+        return None, last_error
+    
+    def _record_failure(self, service, error, role):
+        """
+        Count a failed translator call and log it: the first 3 times,
+        then every 50th.
+        
+        Returns:
+            Number of failures of the service this session
+        """
+        with _fail_count_lock:
+            count = self._fail_counts.pop(service, 0) + 1
+            self._fail_counts[service] = count
+            if len(self._fail_counts) > _MAX_FAIL_COUNT_KEYS:
+                del self._fail_counts[next(iter(self._fail_counts))]
+        
+        if count <= 3 or count % 50 == 0:
+            logger = get_debug_logger()
+            logger.error(f"{role} {service} failed ({count}x): {error}", 'api')
+            if count == 3:
+                logger.error(f"Suppressing further {service} errors (will log every 50th)", 'api')
+        return count
+    
+    def _rate_limited(self, service):
+        """True while a service is inside its backoff deadline after a 429."""
+        return time.monotonic() < self._service_not_before.get(service, 0)
+    
+    def _call_translator(self, service, translator, texts):
+        """
+        translate_batch through the service's circuit breaker. A service
+        that answered HTTP 429 is skipped until its backoff deadline
+        instead of blocking the worker thread in a sleep.
+        
+        Raises:
+            CircuitOpenError: without a request, while the breaker is open
+                or the service is backing off
+        """
+        if self._rate_limited(service):
+            raise CircuitOpenError(f"{service} is rate limited, skipped for now")
+        breaker = _get_circuit_breaker(service, translator.config.get('url'))
+        if not breaker.allow():
+            raise CircuitOpenError(f"{service} is failing, skipped for now")
+        
+        try:
+            result = translator.translate_batch(texts, self.source_language, self.target_language)
+        except Exception as e:
+            if breaker.record(False) == 'open':
+                log(f"{service} failed {breaker.fail_count} times in a row, pausing it for "
+                    f"{breaker.SLEEP_WINDOW}s", level=xbmc.LOGWARNING)
+            from lib.translators import RateLimitError
+            if isinstance(e, RateLimitError):
+                # Retry-After if given, else exponential in the failures in
+                # a row; capped at 32 s either way
+                backoff = min(e.retry_after or 2 ** min(breaker.fail_count - 1, 5), 32)
+                self._service_not_before[service] = time.monotonic() + backoff
+                get_debug_logger().info(f"Rate limited by {service}, skipping it for {backoff}s", 'api')
+            raise
+        
+        if breaker.record(True) == 'closed':
+            log(f"{service} is answering again")
+        return result
+    
+    # Races in a row the primary may lose before a fallback takes over
+    _MAX_PRIMARY_MISSES = 3
+    
+    def _race_translators(self, translator, texts, batch_num, fallback_services, progress):
+        """
+        Send a batch to the primary and every fallback at once and take the
+        first reply that changed the text, so a dead service's timeout no
+        longer holds up the batch. Billed services are not raced, since an
+        abandoned request would still be paid for and keep one of the
+        service's request slots: a billed primary is tried first on its
+        own, then the free services race, then billed fallbacks follow in
+        turn. Once the primary has lost _MAX_PRIMARY_MISSES batches in a
+        row, the winning fallback gets the remaining batches on its own.
+        
+        Returns:
+            (translated texts, or None if every service failed; last error)
+        """
+        candidates = [(self.translation_service, translator)]
+        for service in fallback_services:
+            if service != self.translation_service:
+                candidates.append((service, self._get_fallback_translator(service)))
+        # Rate-limited services are skipped rather than waited for
+        candidates = [c for c in candidates if not self._rate_limited(c[0])]
+        if not candidates:
+            return None, CircuitOpenError("Every service is rate limited")
+        
+        billed = [c for c in candidates if c[1].billed]
+        stages = []
+        if billed and billed[0][0] == self.translation_service:
+            stages.append([billed.pop(0)])
+        free = [c for c in candidates if not c[1].billed]
+        if free:
+            stages.append(free)
+        stages.extend([c] for c in billed)
+        
+        last_error = None
+        echoed = None
+        for stage in stages:
+            winner, translated_texts, error = self._first_translation(stage, texts)
+            last_error = error or last_error
+            if winner is not None:
+                get_debug_logger().debug(
+                    f"Batch {batch_num + 1}: {winner} answered first", 'api')
+                self._count_primary_miss(winner, candidates, progress)
+                return translated_texts, last_error
+            if echoed is None:
+                echoed = translated_texts
+        return echoed, last_error
+    
+    def _first_translation(self, candidates, texts):
+        """
+        Send texts to every candidate at once and take the first reply
+        that changed the text. A reply identical to the input only counts
+        if nothing better arrives within the request timeout. Slower
+        requests are abandoned.
+        
+        Returns:
+            (winning service or None, its translation or the first echoed
+            reply or None, last error)
+        """
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+        
+        pool = ThreadPoolExecutor(max_workers=len(candidates))
+        futures = {
+            pool.submit(self._call_translator, name, t, texts): name
+            for name, t in candidates
+        }
+        pending = set(futures)
+        last_error = None
+        # First reply that came back untranslated, and until when the
+        # other services may still beat it
+        echoed = None
+        deadline = None
+        
+        try:
+            while pending:
+                timeout = None if deadline is None else max(0, deadline - time.monotonic())
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+                for future in done:
+                    try:
+                        translated_texts = future.result()
+                    except Exception as e:
+                        last_error = e
+                        continue
+                    if translated_texts == texts:
+                        # Not a win: an echo must not beat a real translation
+                        if echoed is None:
+                            echoed = translated_texts
+                            deadline = time.monotonic() + self.request_timeout
+                        continue
+                    return futures[future], translated_texts, last_error
+            return None, echoed, last_error
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=False)
+    
+    def _count_primary_miss(self, winner, candidates, progress):
+        """Track races lost by the primary and hand over to the winner."""
+        with _fail_count_lock:
+            if winner == self.translation_service:
+                self._primary_misses = 0
+                return
+            self._primary_misses += 1
+            if (self._primary_misses < self._MAX_PRIMARY_MISSES
+                    or self._settled_fallback is not None):
+                return
+            self._settled_fallback = (winner, dict(candidates)[winner])
+        
+        log(f"{self.translation_service} lost {self._primary_misses} batches in a row, "
+            f"sending the rest to {winner}", level=xbmc.LOGWARNING)
+        progress.set_service(winner)
+    
+    def _get_fallback_translator(self, service):
+        """Fallback translator for the current job, built on first use."""
+        with _fail_count_lock:
+            translator = self._fallback_translators.get(service)
+            if translator is None:
+                translator = self._fallback_translators[service] = get_translator(
+                    service, self._get_fallback_config(service))
+        return translator
+    
+    # Fallback services that take a URL, and the attribute holding it
+    _FALLBACK_URLS = {'lingva': 'lingva_url', 'libretranslate': 'libretranslate_url'}
+    
     def _get_fallback_config(self, service):
         """Get config for a fallback service (e.g. lingva)."""
-        config = {'timeout': get_setting_int('request_timeout')}
-        if service == 'lingva':
-            config['url'] = get_setting('lingva_url') or 'https://lingva.ml'
-        elif service == 'libretranslate':
-            config['url'] = get_setting('libretranslate_url') or 'https://translate.argosopentech.com'
+        config = {'timeout': self.request_timeout, 'concurrency': self.translation_concurrency}
+        url = self._FALLBACK_URLS.get(service)
+        if url:
+            config['url'] = getattr(self, url)
+        config['session'] = get_http_session()
+        config['pack_short_lines'] = self.pack_short_lines
+        if self.cache_translations:
+            config['translation_memory'] = get_translation_memory()
         return config
     
+    def _hashed_cache_key(self, *parts):
+        """Hash of the '|'-joined parts (BLAKE2b, not security relevant),
+        memoized on the parts tuple for the lifetime of the player."""
+        key = self._cache_keys.get(parts)
+        if key is None:
+            import hashlib
+            key_data = '|'.join(map(str, parts))
+            key = self._cache_keys.setdefault(
+                parts, hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest())
+        return key
+    
     def get_cache_key_external(self, subtitle_path):
         """Generate a unique cache key for an external subtitle file."""
-        key_data = f"ext|{subtitle_path}|{self.target_language}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+        return self._hashed_cache_key('ext', subtitle_path, self.target_language)
     
     def get_cache_key(self, source_sub):
         """Generate a unique cache key for the subtitle."""
-        key_data = f"{self.current_file}|{source_sub.get('index', 0)}|{self.target_language}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+        return self._hashed_cache_key(self.current_file, source_sub.get('index', 0), self.target_language)
+    
+    def get_content_cache_key(self, subtitle_content):
+        """
+        Generate a cache key from the source subtitle itself, so the same
+        track in a moved or re-encoded video reuses its translation.
+        """
+        if isinstance(subtitle_content, str):
+            subtitle_content = subtitle_content.encode('utf-8', 'replace')
+        suffix = f"|{self.target_language}".encode()
+        
+        # xxhash is much faster when installed (not bundled with Kodi); its
+        # keys get their own prefix so they never collide with SHA-1 ones
+        try:
+            from xxhash import xxh3_128
+        except ImportError:
+            import hashlib
+            digest = hashlib.sha1(subtitle_content)
+            digest.update(suffix)
+            return f"content_{digest.hexdigest()}"
+        
+        digest = xxh3_128(subtitle_content)
+        digest.update(suffix)
+        return f"contentx_{digest.hexdigest()}"
+    
+    def _load_from_content_cache(self, content_key, cache_key, progress):
+        """
+        Load a translation cached under the source content key, storing it
+        under cache_key as well.
+        
+        Returns:
+            True if a cached translation was loaded
+        """
+        cached_path = self.get_cached_subtitle(content_key)
+        if not cached_path:
+            return False
+        
+        get_debug_logger().info(f"Content cache hit: {cached_path}", 'cache')
+        output_path = self.save_subtitle(None, cache_key, source_path=cached_path)
+        self.load_subtitle(output_path)
+        progress.complete(True, get_string(30705))  # Using cached translation
+        return True
+    
+    def _cache_files(self, cache_key):
+        """
+        Find cached subtitles for a key.
+        
+        Cache files are named {key}.{epoch}.{format}, so the age is read
+        from the name with a single directory scan and no metadata file.
+        
+        Returns:
+            List of (epoch, path), unordered
+        """
+        found = []
+        pattern = f"{self._cache_glob_prefix}{glob.escape(cache_key)}.*.{self.subtitle_format}"
+        for path in glob.glob(pattern):
+            try:
+                found.append((int(os.path.basename(path).split('.')[1]), path))
+            except (IndexError, ValueError):
+                continue
+        return found
+    
+    # Extensions of cache files from before the {key}.{epoch}.{format}
+    # naming ({key}.{format} plus a {key}.json timestamp). Their keys used
+    # another hash, so no lookup can reach them any more.
+    _LEGACY_CACHE_EXTS = frozenset(('srt', 'ass', 'ssa', 'vtt', 'json'))
+    
+    def _prune_cache(self):
+        """Delete cache files older than cache_days, and old-format files.
+        Lookups already ignore them; this only keeps the cache directory
+        small."""
+        try:
+            cutoff = time.time() - self.cache_days * 24 * 60 * 60
+            removed = 0
+            for path in glob.glob(f"{self._cache_glob_prefix}*.*"):
+                parts = os.path.basename(path).split('.')
+                if len(parts) == 2:
+                    expired = parts[1] in self._LEGACY_CACHE_EXTS
+                else:
+                    try:
+                        expired = int(parts[1]) < cutoff
+                    except ValueError:
+                        continue
+                if expired and xbmcvfs.delete(path):
+                    removed += 1
+            if removed:
+                log(f"Removed {removed} expired cache file(s)")
+            if self.cache_translations:
+                get_translation_memory().prune()
+        except Exception as e:
+            log(f"Cache cleanup failed: {e}", level=xbmc.LOGWARNING)
     
     def get_cached_subtitle(self, cache_key):
-        """Get path to cached subtitle if it exists and is valid."""
+        """Get path to cached subtitle if it exists and is valid.
+        Entries remembered from earlier lookups or saves are checked with
+        a single stat instead of a directory scan."""
         if not self.cache_translations:
             return None
         
-        cache_file = os.path.join(get_cache_path(), f"{cache_key}.{self.subtitle_format}")
-        meta_file = os.path.join(get_cache_path(), f"{cache_key}.json")
-        
-        if not xbmcvfs.exists(cache_file) or not xbmcvfs.exists(meta_file):
-            return None
+        newest = self._cache_index.get(cache_key)
+        if newest is None or not xbmcvfs.exists(newest[1]):
+            newest = max(self._cache_files(cache_key), default=None)
+            if newest is None:
+                self._cache_index.pop(cache_key, None)
+                return None
+            self._cache_index[cache_key] = newest
         
         # Check cache age
-        try:
-            with xbmcvfs.File(meta_file, 'r') as f:
-                meta = json.loads(f.read())
-            
-            cache_time = meta.get('timestamp', 0)
-            max_age = self.cache_days * 24 * 60 * 60
-            
-            if time.time() - cache_time > max_age:
-                log(f"Cache expired for {cache_key}")
-                return None
-            
-            return cache_file
-        except:
+        cache_time, cache_file = newest
+        max_age = self.cache_days * 24 * 60 * 60
+        if time.time() - cache_time > max_age:
+            log(f"Cache expired for {cache_key}")
             return None
+        
+        return cache_file
     
     def _normalize_path(self, path):
         """Normalize path separators for network paths (SMB uses forward slashes)."""
@@ -1313,12 +1792,9 @@ class SubtitleTranslatorPlayer(xbmc.Player):
                 log(f"Subtitle already exists alongside video: {alongside_path}")
                 return alongside_path
             
-            # Read source and write to destination
-            with xbmcvfs.File(source_path, 'r') as src:
-                content = src.read()
-            
-            with xbmcvfs.File(alongside_path, 'w') as dst:
-                dst.write(content)
+            # Let Kodi copy natively (no round trip through Python)
+            if not xbmcvfs.copy(source_path, alongside_path):
+                raise IOError(f"xbmcvfs.copy failed for {alongside_path}")
             
             log(f"Copied subtitle alongside video: {alongside_path}")
             return alongside_path
@@ -1326,6 +1802,25 @@ class SubtitleTranslatorPlayer(xbmc.Player):
             log(f"Could not copy subtitle alongside video: {e}", level=xbmc.LOGWARNING)
             return None
     
+    @staticmethod
+    def _iter_output_entries(entries, trans_map, disclaimer_entries):
+        """
+        Yield the disclaimer followed by the translated entries, with
+        indices shifted past the disclaimer. The parsed entries are
+        private to the job, so they are updated in place.
+        """
+        for i, d in enumerate(disclaimer_entries):
+            d['index'] = i + 1
+            yield d
+        
+        shift = len(disclaimer_entries)
+        for entry in entries:
+            text = entry['text']
+            # The parser numbers every entry it yields
+            entry['index'] += shift
+            entry['text'] = trans_map.get(text.strip(), text)
+            yield entry
+    
     @staticmethod
     def _make_disclaimer(service_label):
         """Create disclaimer subtitle entries shown during the first 7 seconds.
@@ -1357,21 +1852,43 @@ class SubtitleTranslatorPlayer(xbmc.Player):
             },
         ]
 
-    def save_subtitle(self, content, cache_key):
-        """Save translated subtitle to cache and optionally alongside video."""
-        # Save to cache
-        cache_file = os.path.join(get_cache_path(), f"{cache_key}.{self.subtitle_format}")
-        meta_file = os.path.join(get_cache_path(), f"{cache_key}.json")
-        
-        with xbmcvfs.File(cache_file, 'w') as f:
-            f.write(content)
-        
-        with xbmcvfs.File(meta_file, 'w') as f:
-            f.write(json.dumps({
-                'timestamp': time.time(),
-                'source_file': self.current_file,
-                'target_language': self.target_language
-            }))
+    @staticmethod
+    def _write_file(path, content, chunk_size=65536):
+        """Write content to a (possibly remote) file in chunks.
+        Text is encoded to UTF-8 once and written as bytes."""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        with xbmcvfs.File(path, 'wb') as f:
+            if len(content) <= chunk_size:
+                f.write(content)
+                return
+            for start in range(0, len(content), chunk_size):
+                f.write(content[start:start + chunk_size])
+    
+    def save_subtitle(self, content, cache_key, content_key=None, source_path=None):
+        """Save translated subtitle to cache and optionally alongside video.
+        If content_key is given the cache file is also stored under it.
+        If source_path is given that file is copied instead of writing content."""
+        # Replace older cached copies for this key
+        for _, old_file in self._cache_files(cache_key):
+            xbmcvfs.delete(old_file)
+        
+        # Save to cache; the timestamp in the name is the cache age
+        stamp = int(time.time())
+        cache_file = f"{self._cache_prefix}{cache_key}.{stamp}.{self.subtitle_format}"
+        
+        if source_path:
+            xbmcvfs.copy(source_path, cache_file)
+        else:
+            self._write_file(cache_file, content)
+        self._cache_index[cache_key] = (stamp, cache_file)
+        
+        if content_key:
+            for _, old_file in self._cache_files(content_key):
+                xbmcvfs.delete(old_file)
+            content_file = f"{self._cache_prefix}{content_key}.{stamp}.{self.subtitle_format}"
+            xbmcvfs.copy(cache_file, content_file)
+            self._cache_index[content_key] = (stamp, content_file)
         
         output_path = cache_file
         
@@ -1385,8 +1902,9 @@ class SubtitleTranslatorPlayer(xbmc.Player):
             ))
             
             try:
-                with xbmcvfs.File(alongside_path, 'w') as f:
-                    f.write(content)
+                # Copy the cache file rather than writing the content twice
+                if not xbmcvfs.copy(cache_file, alongside_path):
+                    raise IOError(f"xbmcvfs.copy failed for {alongside_path}")
                 output_path = alongside_path
                 log(f"Saved subtitle alongside video: {alongside_path}")
             except Exception as e:
@@ -1396,42 +1914,34 @@ class SubtitleTranslatorPlayer(xbmc.Player):
     
     def load_subtitle(self, path):
         """Load a subtitle file into the player and enable it."""
+        # setSubtitles appends the file as the last stream and selects it
         self.setSubtitles(path)
         
-        # Enable subtitle visibility and select the new subtitle
-        xbmc.sleep(500)  # Give Kodi time to load the subtitle
-        
         try:
-            # Get available subtitles to find the index of the one we just added
-            result = execute_jsonrpc('Player.GetProperties', {
-                'playerid': 1,
-                'properties': ['subtitles', 'currentsubtitle', 'subtitleenabled']
-            })
-            
-            if result and 'result' in result:
-                subtitles = result['result'].get('subtitles', [])
-                
-                # Find our subtitle (usually the last one added, or match by name)
-                new_sub_index = len(subtitles) - 1 if subtitles else 0
-                
-                # Look for exact path match
-                for i, sub in enumerate(subtitles):
-                    if sub.get('name', '').endswith(os.path.basename(path)):
-                        new_sub_index = i
-                        break
-                
-                # Enable subtitles and select the new one
-                execute_jsonrpc('Player.SetSubtitle', {
+            # One batched round trip: turn display on and read back the
+            # streams to verify our subtitle is the selected one
+            _, props = execute_jsonrpc([
+                ('Player.SetSubtitle', {'playerid': 1, 'subtitle': 'on'}),
+                ('Player.GetProperties', {
                     'playerid': 1,
-                    'subtitle': new_sub_index,
-                    'enable': True
+                    'properties': ['subtitles', 'currentsubtitle']
                 })
-                log(f"Selected subtitle index {new_sub_index} and enabled display")
-            else:
-                # Fallback: just enable subtitles via built-in
-                xbmc.executebuiltin('ActivateWindow(SubtitleSearch)')
-                xbmc.sleep(100)
-                xbmc.executebuiltin('Action(Close)')
+            ])
+            
+            if props:
+                subtitles = props.get('subtitles', [])
+                current = props.get('currentsubtitle') or {}
+                basename = os.path.basename(path)
+                
+                if subtitles and not current.get('name', '').endswith(basename):
+                    # setSubtitles appends, so ours is the last stream
+                    new_sub_index = len(subtitles) - 1
+                    execute_jsonrpc('Player.SetSubtitle', {
+                        'playerid': 1,
+                        'subtitle': new_sub_index,
+                        'enable': True
+                    })
+                    log(f"Selected subtitle index {new_sub_index} and enabled display")
                 
         except Exception as e:
             log(f"Could not auto-select subtitle: {e}", level=xbmc.LOGWARNING)
@@ -1440,97 +1950,112 @@ class SubtitleTranslatorPlayer(xbmc.Player):
         self.showSubtitles(True)
         log(f"Loaded and activated subtitle: {path}")
     
+    # Settings read into each service's config: (config key, setting key)
+    _SERVICE_SETTINGS = {
+        'deepl': (('api_key', 'deepl_api_key'), ('formality', 'deepl_formality')),
+        'deepl_free': (('api_key', 'deepl_api_key'), ('formality', 'deepl_formality')),
+        'libretranslate': (('url', 'libretranslate_url'), ('api_key', 'libretranslate_api_key')),
+        'google': (('api_key', 'google_api_key'),),
+        'microsoft': (('api_key', 'microsoft_api_key'), ('region', 'microsoft_region')),
+        'lingva': (('url', 'lingva_url'),),
+        'openai': (('api_key', 'openai_api_key'), ('model', 'openai_model'),
+                   ('base_url', 'openai_base_url')),
+        'anthropic': (('api_key', 'anthropic_api_key'), ('model', 'anthropic_model')),
+        'argos': (('package_path', 'argos_package_path'),),
+    }
+    
     def get_service_config(self):
         """Get configuration for the selected translation service."""
+        service = self.translation_service
         config = {
-            'timeout': get_setting_int('request_timeout')
+            'timeout': self.request_timeout,
+            'concurrency': self.translation_concurrency
         }
+        config.update({name: get_setting(key) for name, key in self._SERVICE_SETTINGS.get(service, ())})
+        
+        if service in ('deepl', 'deepl_free'):
+            config['free'] = service == 'deepl_free'
+        if not config.get('base_url'):
+            config.pop('base_url', None)
         
-        if self.translation_service == 'deepl':
-            config['api_key'] = get_setting('deepl_api_key')
-            config['formality'] = get_setting('deepl_formality')
-            config['free'] = False
-        elif self.translation_service == 'deepl_free':
-            config['api_key'] = get_setting('deepl_api_key')
-            config['formality'] = get_setting('deepl_formality')
-            config['free'] = True
-        elif self.translation_service == 'libretranslate':
-            config['url'] = get_setting('libretranslate_url')
-            config['api_key'] = get_setting('libretranslate_api_key')
-        elif self.translation_service == 'google':
-            config['api_key'] = get_setting('google_api_key')
-        elif self.translation_service == 'microsoft':
-            config['api_key'] = get_setting('microsoft_api_key')
-            config['region'] = get_setting('microsoft_region')
-        elif self.translation_service == 'lingva':
-            config['url'] = get_setting('lingva_url')
-        elif self.translation_service == 'openai':
-            config['api_key'] = get_setting('openai_api_key')
-            config['model'] = get_setting('openai_model')
-            base_url = get_setting('openai_base_url')
-            if base_url:
-                config['base_url'] = base_url
-        elif self.translation_service == 'anthropic':
-            config['api_key'] = get_setting('anthropic_api_key')
-            config['model'] = get_setting('anthropic_model')
-        elif self.translation_service == 'argos':
-            config['package_path'] = get_setting('argos_package_path')
+        config['session'] = get_http_session()
+        config['pack_short_lines'] = self.pack_short_lines
+        if self.cache_translations:
+            config['translation_memory'] = get_translation_memory()
         
         return config
     
+    # Language codes to the sets of tags that name them in filenames
+    _LANG_VARIANTS = {
+        'en': frozenset(('en', 'eng', 'english')),
+        'eng': frozenset(('en', 'eng', 'english')),
+        'sv': frozenset(('sv', 'swe', 'swedish')),
+        'swe': frozenset(('sv', 'swe', 'swedish')),
+        'no': frozenset(('no', 'nor', 'nob', 'norwegian')),
+        'nor': frozenset(('no', 'nor', 'nob', 'norwegian')),
+        'da': frozenset(('da', 'dan', 'danish')),
+        'dan': frozenset(('da', 'dan', 'danish')),
+        'fi': frozenset(('fi', 'fin', 'finnish')),
+        'fin': frozenset(('fi', 'fin', 'finnish')),
+        'de': frozenset(('de', 'ger', 'deu', 'german')),
+        'ger': frozenset(('de', 'ger', 'deu', 'german')),
+        'deu': frozenset(('de', 'ger', 'deu', 'german')),
+        'fr': frozenset(('fr', 'fre', 'fra', 'french')),
+        'fre': frozenset(('fr', 'fre', 'fra', 'french')),
+        'fra': frozenset(('fr', 'fre', 'fra', 'french')),
+        'es': frozenset(('es', 'spa', 'spanish')),
+        'spa': frozenset(('es', 'spa', 'spanish')),
+        'it': frozenset(('it', 'ita', 'italian')),
+        'ita': frozenset(('it', 'ita', 'italian')),
+        'pt': frozenset(('pt', 'por', 'portuguese')),
+        'por': frozenset(('pt', 'por', 'portuguese')),
+        'pl': frozenset(('pl', 'pol', 'polish')),
+        'pol': frozenset(('pl', 'pol', 'polish')),
+        'nl': frozenset(('nl', 'dut', 'nld', 'dutch')),
+        'dut': frozenset(('nl', 'dut', 'nld', 'dutch')),
+        'nld': frozenset(('nl', 'dut', 'nld', 'dutch')),
+        'ru': frozenset(('ru', 'rus', 'russian')),
+        'rus': frozenset(('ru', 'rus', 'russian')),
+        'ja': frozenset(('ja', 'jpn', 'japanese')),
+        'jpn': frozenset(('ja', 'jpn', 'japanese')),
+        'zh': frozenset(('zh', 'chi', 'zho', 'chinese')),
+        'chi': frozenset(('zh', 'chi', 'zho', 'chinese')),
+        'zho': frozenset(('zh', 'chi', 'zho', 'chinese')),
+        'ko': frozenset(('ko', 'kor', 'korean')),
+        'kor': frozenset(('ko', 'kor', 'korean')),
+        'ar': frozenset(('ar', 'ara', 'arabic')),
+        'ara': frozenset(('ar', 'ara', 'arabic')),
+        'tr': frozenset(('tr', 'tur', 'turkish')),
+        'tur': frozenset(('tr', 'tur', 'turkish')),
+    }
+    
     def _get_language_variants(self, lang_code):
-        """Get common variations of a language code for matching."""
+        """Get the set of common variations of a language code for matching."""
         if not lang_code:
-            return []
+            return frozenset()
         
         lang_lower = lang_code.lower()
-        
-        # Map of language codes to their common variants
-        lang_variants = {
-            'en': ['en', 'eng', 'english'],
-            'eng': ['en', 'eng', 'english'],
-            'sv': ['sv', 'swe', 'swedish'],
-            'swe': ['sv', 'swe', 'swedish'],
-            'no': ['no', 'nor', 'nob', 'norwegian'],
-            'nor': ['no', 'nor', 'nob', 'norwegian'],
-            'da': ['da', 'dan', 'danish'],
-            'dan': ['da', 'dan', 'danish'],
-            'fi': ['fi', 'fin', 'finnish'],
-            'fin': ['fi', 'fin', 'finnish'],
-            'de': ['de', 'ger', 'deu', 'german'],
-            'ger': ['de', 'ger', 'deu', 'german'],
-            'deu': ['de', 'ger', 'deu', 'german'],
-            'fr': ['fr', 'fre', 'fra', 'french'],
-            'fre': ['fr', 'fre', 'fra', 'french'],
-            'fra': ['fr', 'fre', 'fra', 'french'],
-            'es': ['es', 'spa', 'spanish'],
-            'spa': ['es', 'spa', 'spanish'],
-            'it': ['it', 'ita', 'italian'],
-            'ita': ['it', 'ita', 'italian'],
-            'pt': ['pt', 'por', 'portuguese'],
-            'por': ['pt', 'por', 'portuguese'],
-            'pl': ['pl', 'pol', 'polish'],
-            'pol': ['pl', 'pol', 'polish'],
-            'nl': ['nl', 'dut', 'nld', 'dutch'],
-            'dut': ['nl', 'dut', 'nld', 'dutch'],
-            'nld': ['nl', 'dut', 'nld', 'dutch'],
-            'ru': ['ru', 'rus', 'russian'],
-            'rus': ['ru', 'rus', 'russian'],
-            'ja': ['ja', 'jpn', 'japanese'],
-            'jpn': ['ja', 'jpn', 'japanese'],
-            'zh': ['zh', 'chi', 'zho', 'chinese'],
-            'chi': ['zh', 'chi', 'zho', 'chinese'],
-            'zho': ['zh', 'chi', 'zho', 'chinese'],
-            'ko': ['ko', 'kor', 'korean'],
-            'kor': ['ko', 'kor', 'korean'],
-            'ar': ['ar', 'ara', 'arabic'],
-            'ara': ['ar', 'ara', 'arabic'],
-            'tr': ['tr', 'tur', 'turkish'],
-            'tur': ['tr', 'tur', 'turkish'],
-        }
-        
-        variants = lang_variants.get(lang_lower, [lang_lower])
-        return list(dict.fromkeys(variants))  # Deduplicate
+        return self._LANG_VARIANTS.get(lang_lower) or frozenset((lang_lower,))
+    
+    # Language codes/names recognised as the last part of a subtitle filename
+    _FILENAME_LANG_CODES = frozenset({
+        'en', 'eng', 'english', 'sv', 'swe', 'swedish',
+        'no', 'nor', 'nob', 'norwegian', 'da', 'dan', 'danish',
+        'fi', 'fin', 'finnish', 'de', 'ger', 'deu', 'german',
+        'fr', 'fre', 'fra', 'french', 'es', 'spa', 'spanish',
+        'it', 'ita', 'italian', 'pt', 'por', 'portuguese',
+        'pl', 'pol', 'polish', 'nl', 'dut', 'nld', 'dutch',
+        'ru', 'rus', 'russian', 'uk', 'ukr', 'ukrainian',
+        'ja', 'jpn', 'japanese', 'zh', 'chi', 'zho', 'chinese',
+        'ko', 'kor', 'korean', 'ar', 'ara', 'arabic',
+        'tr', 'tur', 'turkish', 'hi', 'hin', 'hindi',
+        'th', 'tha', 'thai', 'vi', 'vie', 'vietnamese',
+        'id', 'ind', 'indonesian', 'el', 'gre', 'ell', 'greek',
+        'cs', 'cze', 'ces', 'czech', 'ro', 'rum', 'ron', 'romanian',
+        'hu', 'hun', 'hungarian', 'he', 'heb', 'hebrew',
+        'ms', 'may', 'msa', 'malay', 'fil', 'tl', 'tagalog',
+        'ta', 'tam', 'tamil', 'te', 'tel', 'telugu',
+    })
     
     def _parse_language_from_filename(self, filename):
         """
@@ -1546,42 +2071,23 @@ class SubtitleTranslatorPlayer(xbmc.Player):
             Language code string or None
         """
         name_without_ext = os.path.splitext(filename)[0]
-        parts = name_without_ext.split('.')
+        _, sep, candidate = name_without_ext.rpartition('.')
         
-        if len(parts) < 2:
+        if not sep:
             return None
         
         # The language code is typically the last part before the extension
-        candidate = parts[-1].lower()
-        
-        # Check against known language codes/names
-        known_codes = {
-            'en', 'eng', 'english', 'sv', 'swe', 'swedish',
-            'no', 'nor', 'nob', 'norwegian', 'da', 'dan', 'danish',
-            'fi', 'fin', 'finnish', 'de', 'ger', 'deu', 'german',
-            'fr', 'fre', 'fra', 'french', 'es', 'spa', 'spanish',
-            'it', 'ita', 'italian', 'pt', 'por', 'portuguese',
-            'pl', 'pol', 'polish', 'nl', 'dut', 'nld', 'dutch',
-            'ru', 'rus', 'russian', 'uk', 'ukr', 'ukrainian',
-            'ja', 'jpn', 'japanese', 'zh', 'chi', 'zho', 'chinese',
-            'ko', 'kor', 'korean', 'ar', 'ara', 'arabic',
-            'tr', 'tur', 'turkish', 'hi', 'hin', 'hindi',
-            'th', 'tha', 'thai', 'vi', 'vie', 'vietnamese',
-            'id', 'ind', 'indonesian', 'el', 'gre', 'ell', 'greek',
-            'cs', 'cze', 'ces', 'czech', 'ro', 'rum', 'ron', 'romanian',
-            'hu', 'hun', 'hungarian', 'he', 'heb', 'hebrew',
-            'ms', 'may', 'msa', 'malay', 'fil', 'tl', 'tagalog',
-            'ta', 'tam', 'tamil', 'te', 'tel', 'telugu',
-        }
-        
-        if candidate in known_codes:
+        candidate = candidate.lower()
+        if candidate in self._FILENAME_LANG_CODES:
             return candidate
         
         return None
     
     def _list_external_subtitles(self):
         """
-        List all external subtitle files for the current video.
+        List all external subtitle files for the current video. The listing
+        is kept for the rest of the playback, so the target and source
+        lookups share one directory read.
         
         Returns:
             List of dicts: [{'path': str, 'language': str or None, 'filename': str}, ...]
@@ -1589,9 +2095,14 @@ class SubtitleTranslatorPlayer(xbmc.Player):
         if not self.current_file:
             return []
         
+        cached = self._external_listing
+        if cached is not None and cached[0] == self.current_file:
+            return cached[1]
+        
         video_dir = os.path.dirname(self.current_file)
         video_name = os.path.splitext(os.path.basename(self.current_file))[0]
-        sub_extensions = ['.srt', '.ass', '.ssa', '.sub', '.vtt']
+        video_prefix = video_name.lower()
+        sub_extensions = ('.srt', '.ass', '.ssa', '.sub', '.vtt')
         results = []
         
         try:
@@ -1599,9 +2110,9 @@ class SubtitleTranslatorPlayer(xbmc.Player):
             
             for filename in files:
                 name_lower = filename.lower()
-                if not any(name_lower.endswith(ext) for ext in sub_extensions):
+                if not name_lower.endswith(sub_extensions):
                     continue
-                if not name_lower.startswith(video_name.lower()):
+                if not name_lower.startswith(video_prefix):
                     continue
                 
                 full_path = self._normalize_path(os.path.join(video_dir, filename))
@@ -1617,6 +2128,7 @@ class SubtitleTranslatorPlayer(xbmc.Player):
         except Exception as e:
             log(f"Error listing external subtitles: {e}", level=xbmc.LOGWARNING)
         
+        self._external_listing = (self.current_file, results)
         return results
     
     def find_external_subtitle(self, source_lang=None):
@@ -1637,7 +2149,7 @@ class SubtitleTranslatorPlayer(xbmc.Player):
             return None
         
         # Build language variants to match
-        lang_codes = self._get_language_variants(source_lang) if source_lang else ['en', 'eng', 'english']
+        lang_codes = self._get_language_variants(source_lang or 'en')
         
         # First pass: find subtitle with matching language code
         for sub in all_subs:
@@ -1725,50 +2237,25 @@ class SubtitleTranslatorPlayer(xbmc.Player):
             log(f"Error reading external subtitle: {e}", level=xbmc.LOGERROR)
             return None
     
+    # Map language codes to string IDs (30800+). Keyed by the codes
+    # normalize_lang() produces, plus the few that don't normalize
+    _CODE_TO_STRING_ID = {
+        'sv': 30800, 'en': 30801, 'no': 30802, 'da': 30803, 'fi': 30804,
+        'de': 30805, 'fr': 30806, 'es': 30807, 'it': 30808, 'pt': 30809,
+        'pl': 30810, 'nl': 30811, 'ru': 30812, 'uk': 30813, 'ja': 30814,
+        'zh': 30815, 'zh-tw': 30816, 'ko': 30817, 'ar': 30818, 'tr': 30819,
+        'hi': 30820, 'th': 30821, 'vi': 30822, 'id': 30823, 'el': 30824,
+        'cs': 30825, 'ro': 30826, 'hu': 30827, 'he': 30828, 'auto': 30829,
+        'ms': 30830, 'fil': 30831, 'tl': 30831, 'ta': 30832, 'te': 30833,
+    }
+    
     def get_language_name(self, code):
         """Get localized language name from code."""
-        # Map language codes to string IDs (30800+)
-        code_to_string_id = {
-            'sv': 30800, 'swe': 30800,
-            'en': 30801, 'eng': 30801,
-            'no': 30802, 'nor': 30802, 'nob': 30802,
-            'da': 30803, 'dan': 30803,
-            'fi': 30804, 'fin': 30804,
-            'de': 30805, 'ger': 30805, 'deu': 30805,
-            'fr': 30806, 'fre': 30806, 'fra': 30806,
-            'es': 30807, 'spa': 30807,
-            'it': 30808, 'ita': 30808,
-            'pt': 30809, 'por': 30809,
-            'pl': 30810, 'pol': 30810,
-            'nl': 30811, 'dut': 30811, 'nld': 30811,
-            'ru': 30812, 'rus': 30812,
-            'uk': 30813, 'ukr': 30813,
-            'ja': 30814, 'jpn': 30814,
-            'zh': 30815, 'chi': 30815, 'zho': 30815,
-            'zh-TW': 30816,
-            'ko': 30817, 'kor': 30817,
-            'ar': 30818, 'ara': 30818,
-            'tr': 30819, 'tur': 30819,
-            'hi': 30820, 'hin': 30820,
-            'th': 30821, 'tha': 30821,
-            'vi': 30822, 'vie': 30822,
-            'id': 30823, 'ind': 30823,
-            'el': 30824, 'gre': 30824, 'ell': 30824,
-            'cs': 30825, 'cze': 30825, 'ces': 30825,
-            'ro': 30826, 'rum': 30826, 'ron': 30826,
-            'hu': 30827, 'hun': 30827,
-            'he': 30828, 'heb': 30828,
-            'auto': 30829,
-            'ms': 30830, 'may': 30830, 'msa': 30830,
-            'fil': 30831, 'tl': 30831,
-            'ta': 30832, 'tam': 30832,
-            'te': 30833, 'tel': 30833,
-        }
-        
         # Normalize code to lowercase
-        code_lower = code.lower() if code else ''
+        code_lower = sys.intern(code.lower()) if code else ''
         
-        string_id = code_to_string_id.get(code_lower)
+        string_id = (self._CODE_TO_STRING_ID.get(code_lower)
+                     or self._CODE_TO_STRING_ID.get(normalize_lang(code_lower)))
         if string_id:
             return get_string(string_id)
         
@@ -1779,22 +2266,74 @@ class SubtitleTranslatorPlayer(xbmc.Player):
 # Helper functions
 def get_setting(key):
     """Get addon setting. Treats '-' as empty string (Kodi workaround)."""
+    try:
+        return _settings_cache[key]
+    except KeyError:
+        pass
     value = get_addon().getSetting(key)
     # Treat '-' as empty (workaround for Kodi settings v2 empty string issues)
     if value == '-':
-        return ''
+        value = ''
+    _settings_cache[key] = value
     return value
 
 def get_setting_bool(key):
     """Get boolean addon setting."""
-    return get_addon().getSettingBool(key)
+    try:
+        return _settings_cache[(key, 'bool')]
+    except KeyError:
+        pass
+    raw = _settings_cache.get(key)
+    if raw in ('true', 'false'):
+        value = raw == 'true'
+    else:
+        value = get_addon().getSettingBool(key)
+    _settings_cache[(key, 'bool')] = value
+    return value
 
 def get_setting_int(key):
     """Get integer addon setting."""
-    return get_addon().getSettingInt(key)
+    try:
+        return _settings_cache[(key, 'int')]
+    except KeyError:
+        pass
+    try:
+        value = int(_settings_cache[key])
+    except (KeyError, ValueError):
+        value = get_addon().getSettingInt(key)
+    _settings_cache[(key, 'int')] = value
+    return value
 
+def load_all_settings():
+    """
+    Fill the settings cache from the profile's settings.xml in one read,
+    instead of one Kodi call per setting. Settings missing from the file
+    are still read through the addon on first use.
+    """
+    path = os.path.join(get_addon_data(), 'settings.xml')
+    try:
+        import xml.etree.ElementTree as ET
+        root = ET.parse(path).getroot()
+    except Exception as e:
+        log(f"Could not preload settings: {e}", level=xbmc.LOGDEBUG)
+        return
+    
+    for node in root.iter('setting'):
+        key = node.get('id')
+        if not key or key in _settings_cache:
+            continue
+        # Settings v2 stores the value as text, v1 in a value attribute
+        value = node.text if node.text is not None else node.get('value', '')
+        # Treat '-' as empty (workaround for Kodi settings v2 empty string issues)
+        _settings_cache[key] = '' if value == '-' else value
+
+def clear_settings_cache():
+    """Forget cached setting values (call when settings change)."""
+    _settings_cache.clear()
+
+@functools.lru_cache(maxsize=None)
 def get_string(string_id):
-    """Get localized string."""
+    """Get localized string (cached; the catalog is fixed while running)."""
     return get_addon().getLocalizedString(string_id)
 
 def log(message, level=xbmc.LOGINFO):
@@ -1807,23 +2346,44 @@ def notify(message, icon=xbmcgui.NOTIFICATION_INFO, time=5000):
     """Show notification."""
     xbmcgui.Dialog().notification(get_addon_name(), message, icon, time)
 
+@functools.lru_cache(maxsize=32)
+def _jsonrpc_prefix(method, request_id=1):
+    """Constant head of a JSON-RPC request, up to the params value."""
+    return '{"jsonrpc":"2.0","id":%d,"method":%s,"params":' % (request_id, json.dumps(method))
+
+
+# Request sent on every subtitle poll, serialized once at import
+_SUBTITLE_PROPS_REQUEST = _jsonrpc_prefix('Player.GetProperties') + json.dumps({
+    'playerid': 1,
+    'properties': ['subtitles', 'currentsubtitle']
+}) + '}'
+
+
 def execute_jsonrpc(method, params=None):
-    """Execute JSON-RPC command."""
-    request = {
-        'jsonrpc': '2.0',
-        'method': method,
-        'params': params or {},
-        'id': 1
-    }
-    response = xbmc.executeJSONRPC(json.dumps(request))
-    return json.loads(response).get('result')
+    """
+    Execute JSON-RPC command.
+    
+    method may also be a list of (method, params) pairs, which are sent
+    as one JSON-RPC batch; a list of results is returned in the same order.
+    """
+    if isinstance(method, (list, tuple)):
+        request = '[%s]' % ','.join(
+            _jsonrpc_prefix(m, i) + json.dumps(p or {}) + '}'
+            for i, (m, p) in enumerate(method, 1)
+        )
+        response = _json_loads(xbmc.executeJSONRPC(request))
+        if isinstance(response, dict):
+            response = [response]
+        by_id = {r.get('id'): r.get('result') for r in response if isinstance(r, dict)}
+        return [by_id.get(i) for i in range(1, len(method) + 1)]
+    
+    response = xbmc.executeJSONRPC(_jsonrpc_prefix(method) + json.dumps(params or {}) + '}')
+    return _json_loads(response).get('result')
 
 
 def main():
     """Main entry point."""
     try:
-        # Initialize libraries first
-        init_libraries()
         log("Subtitle Translator service started")
         
         monitor = SubtitleTranslatorMonitor()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test that a failing translation service trips its circuit breaker, outside of Kodi.
+Usage: python3 test_circuit_breaker.py
+"""
+
+import sys
+import os
+import types
+import urllib.error
+
+# Add lib to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def install_kodi_modules():
+    """Register minimal xbmc* modules so the service can be imported."""
+    class _Base:
+        def __init__(self, *args, **kwargs):
+            pass
+    
+    xbmc = types.ModuleType('xbmc')
+    xbmc.LOGDEBUG, xbmc.LOGINFO, xbmc.LOGWARNING, xbmc.LOGERROR = 0, 1, 2, 3
+    xbmc.log = lambda message, level=1: None
+    xbmc.Monitor = xbmc.Player = _Base
+    xbmc.executeJSONRPC = lambda request: '{}'
+    
+    xbmcgui = types.ModuleType('xbmcgui')
+    xbmcgui.NOTIFICATION_INFO = 'info'
+    xbmcgui.NOTIFICATION_WARNING = 'warning'
+    xbmcgui.NOTIFICATION_ERROR = 'error'
+    xbmcgui.Dialog = xbmcgui.DialogProgress = _Base
+    
+    xbmcaddon = types.ModuleType('xbmcaddon')
+    xbmcaddon.Addon = _Base
+    
+    xbmcvfs = types.ModuleType('xbmcvfs')
+    xbmcvfs.translatePath = lambda path: path
+    
+    for module in (xbmc, xbmcgui, xbmcaddon, xbmcvfs):
+        sys.modules.setdefault(module.__name__, module)
+
+
+install_kodi_modules()
+
+import service
+from lib.translators import DeepLTranslator, TranslationError
+
+
+def make_player():
+    """Player with just the state _call_translator uses (no settings)."""
+    player = service.SubtitleTranslatorPlayer.__new__(service.SubtitleTranslatorPlayer)
+    player._service_not_before = {}
+    player.source_language = 'en'
+    player.target_language = 'sv'
+    return player
+
+
+def make_dead_translator():
+    """DeepL translator whose every request fails like an unreachable host."""
+    translator = DeepLTranslator({'api_key': 'test:fx'})
+    
+    def send(url, data, headers, method):
+        raise urllib.error.URLError('connection refused')
+    
+    translator._send = send
+    return translator
+
+
+def test_failure_raises():
+    """A failed request must raise, not echo the input back."""
+    translator = make_dead_translator()
+    try:
+        translator.translate_batch(['Hello there.'], 'en', 'sv')
+    except TranslationError:
+        return True
+    return False
+
+
+def test_breaker_opens():
+    """THRESHOLD failed batches in a row open the breaker."""
+    player = make_player()
+    translator = make_dead_translator()
+    breaker = service._get_circuit_breaker('deepl', None)
+    
+    for _ in range(breaker.THRESHOLD):
+        try:
+            player._call_translator('deepl', translator, ['Where are you going?'])
+        except service.CircuitOpenError:
+            return False
+        except TranslationError:
+            continue
+        return False
+    
+    if breaker.opened_at is None:
+        return False
+    try:
+        player._call_translator('deepl', translator, ['Where are you going?'])
+    except service.CircuitOpenError:
+        return True
+    return False
+
+
+def main():
+    failed = 0
+    for test in (test_failure_raises, test_breaker_opens):
+        ok = test()
+        print(f"{'✅' if ok else '❌'} {test.__doc__}")
+        failed += not ok
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()